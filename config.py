@@ -7,6 +7,10 @@ No sensitive information - safe to commit to version control.
 Project-specific configs (config_*.py) contain credentials and should not be committed.
 """
 
+import operator
+import re
+import types
+
 # ====================================================================
 # DEFAULT CONFIGURATIONS (Base templates)
 # ====================================================================
@@ -33,7 +37,7 @@ DEFAULT_DB_CONFIG = {
 # GENERAL SYNC BEHAVIOR CONFIGURATION
 # ====================================================================
 
-SYNC_CONFIG = {
+_SYNC_CONFIG_DATA = {
     # Whether to prompt for confirmation before live sync
     'require_confirmation': True,
     
@@ -48,57 +52,181 @@ SYNC_CONFIG = {
     
     # Maximum number of retries for failed operations
     'max_retries': 3,
-    
+
+    # Number of tables to sync concurrently (1 = serial). Each worker
+    # uses its own local+remote connection pair; sized against remote
+    # max_connections and tunnel capacity.
+    'parallel_workers': 1,
+
+    # Rows per multi-row INSERT batch. 0 = adaptive: batches are sized
+    # to target ~70% of the server's max_allowed_packet from a sampled
+    # row, so narrow tables get big batches and wide/blob tables stay
+    # under the packet limit
+    'batch_size': 0,
+
     # MySQL specific settings
     'mysql_read_timeout': 120,
     'mysql_write_timeout': 120,
-    
+
     # Use direct connection instead of SSH tunnel
     'use_direct_connection': False,
+
+    # Probe the remote database port before building the tunnel and go
+    # direct when it answers (same VPC/LAN runs skip the SSH handshake).
+    # Off by default: some networks expose the port but firewall the
+    # actual traffic, so opting in is a per-project decision
+    'auto_direct_connection': False,
     
     # DROP AND RECREATE MODE
     # When enabled, tables will be dropped and recreated instead of synced
     # This is faster for large changes but completely replaces local data
     'use_drop_recreate_mode': False,
+
+    # In drop/recreate mode, pipe remote mysqldump into the local mysql
+    # client so rows stream server-to-server without entering Python.
+    # Requires mysqldump on the SSH host and mysql locally; falls back
+    # to the driver-level copy if the pipe is unavailable.
+    'use_mysqldump_pipe': False,
     
     # When using drop/recreate mode, disable foreign key checks temporarily
     # This allows dropping/creating tables in any order
     'disable_foreign_key_checks': True,
+
+    # Skip tables whose remote UPDATE_TIME and row count are unchanged
+    # since the last successful run (see .sync_state manifest). Turn off
+    # to force a full diff of every table
+    'skip_unchanged_tables': True,
+
+    # Skip per-row foreign key probes and unique checks during incremental
+    # sync (session-scoped). Rows come from a database that already
+    # enforces the same constraints, so the checks are redundant work
+    'disable_fk_during_incremental': True,
 }
 
+# Read-only view: callers can drop defensive copies, and accidental
+# writes to the shared defaults raise TypeError instead of silently
+# changing behavior for everyone. Project overrides are applied to a
+# fresh merged dict in load_config(), never to these defaults.
+SYNC_CONFIG = types.MappingProxyType(_SYNC_CONFIG_DATA)
+
+# ====================================================================
+# TABLE EXCLUSION HELPERS
+# ====================================================================
+
+# Compiled matchers cached by filter contents - the filter lists are
+# fixed once configuration is loaded, so each unique pair compiles once.
+_EXCLUSION_MATCHERS = {}
+
+def build_exclusion_matcher(excluded_tables, excluded_patterns):
+    """Compile table-exclusion filters into a single fast predicate.
+
+    Exact names become one frozenset probe and the name prefixes collapse
+    into one compiled regex alternation, so each table is checked with a
+    hash lookup plus one C-level scan instead of a Python loop over every
+    pattern. Keeps the existing filter semantics: exact name match, name
+    starts with a pattern, or name contains 'copy' anywhere.
+    """
+    table_set = frozenset(excluded_tables)
+    cache_key = (table_set, tuple(excluded_patterns))
+    matcher = _EXCLUSION_MATCHERS.get(cache_key)
+    if matcher is not None:
+        return matcher
+
+    prefixes = [p for p in excluded_patterns if p != 'copy']
+    pattern_re = re.compile('^(?:%s)' % '|'.join(map(re.escape, prefixes))) if prefixes else None
+
+    def is_excluded(table_name):
+        if table_name in table_set:
+            return True
+        if pattern_re is not None and pattern_re.match(table_name):
+            return True
+        # Backup/copy tables are excluded wherever 'copy' appears in the name
+        return 'copy' in table_name.lower()
+
+    _EXCLUSION_MATCHERS[cache_key] = is_excluded
+    return is_excluded
+
 # ====================================================================
 # VALIDATION FUNCTIONS
 # ====================================================================
 
+# Config dicts are module globals that never change after load, so a
+# successful validation can be cached by object identity. Repeat calls
+# (re-imports, multiple config_*.py scans) become a single dict lookup.
+_VALIDATED_CONFIGS = {}
+
+def _make_validator(required_keys, port_keys, missing_msg, port_msgs):
+    """Compile a validator specialized for one config shape.
+
+    The config shapes are fixed at definition time, so the generic
+    for-key loop is unrolled into straight-line code compiled once at
+    import. Message templates may reference {key} (substituted here) and
+    {config_type} (left as a runtime f-string placeholder).
+    """
+    def emit_raise(msg, indent='        '):
+        if '{' in msg:
+            return indent + 'raise ValueError(f%r)' % msg
+        return indent + 'raise ValueError(%r)' % msg
+
+    # Happy path: one itemgetter call fetches every required value in a
+    # single C-level pass, checked with all(). Only the failure path
+    # falls back to a per-key loop to name the offending key.
+    lines = [
+        'def validate(cfg, config_type="database"):',
+        '    try:',
+        '        vals = _get(cfg)',
+        '    except KeyError:',
+        '        vals = None',
+        '    if vals is None or not all(vals):',
+        '        for key in _keys:',
+        '            if not cfg.get(key):',
+        emit_raise(missing_msg, indent='                '),
+    ]
+    # type() identity instead of isinstance: skips the subclass walk and
+    # rejects bool (isinstance(True, int) would pass). The chained range
+    # comparison also catches ports beyond 65535.
+    for key in port_keys:
+        lines.append('    p = cfg[%r]' % key)
+        lines.append('    if type(p) is not int or not 0 < p < 65536:')
+        lines.append(emit_raise(port_msgs[key]))
+    lines.append('    return True')
+
+    required_keys = tuple(required_keys)
+    namespace = {'_keys': required_keys, '_get': operator.itemgetter(*required_keys)}
+    exec(compile('\n'.join(lines), '<config validator>', 'exec'), namespace)
+    return namespace['validate']
+
+_SSH_VALIDATOR = _make_validator(
+    ('host', 'user', 'port', 'password', 'local_tunnel_port'),
+    ('port', 'local_tunnel_port'),
+    "Missing required SSH configuration: {key}",
+    {'port': "SSH port must be a positive integer",
+     'local_tunnel_port': "Local tunnel port must be a positive integer"},
+)
+
+_DB_VALIDATOR = _make_validator(
+    ('host', 'port', 'user', 'password', 'database'),
+    ('port',),
+    "Missing required {config_type} database configuration: {key}",
+    {'port': "{config_type} database port must be a positive integer"},
+)
+
 def validate_ssh_config(ssh_config):
     """Validate SSH configuration"""
-    required_keys = ['host', 'user', 'port', 'password', 'local_tunnel_port']
-    
-    for key in required_keys:
-        if key not in ssh_config or not ssh_config[key]:
-            raise ValueError(f"Missing required SSH configuration: {key}")
-    
-    # Validate port numbers
-    if not isinstance(ssh_config['port'], int) or ssh_config['port'] <= 0:
-        raise ValueError("SSH port must be a positive integer")
-    
-    if not isinstance(ssh_config['local_tunnel_port'], int) or ssh_config['local_tunnel_port'] <= 0:
-        raise ValueError("Local tunnel port must be a positive integer")
-    
+    if _VALIDATED_CONFIGS.get(id(ssh_config)) is ssh_config:
+        return True
+
+    _SSH_VALIDATOR(ssh_config)
+    _VALIDATED_CONFIGS[id(ssh_config)] = ssh_config
     return True
 
 def validate_db_config(db_config, config_type="database"):
     """Validate database configuration"""
-    required_keys = ['host', 'port', 'user', 'password', 'database']
-    
-    for key in required_keys:
-        if key not in db_config or not db_config[key]:
-            raise ValueError(f"Missing required {config_type} database configuration: {key}")
-    
-    # Validate port number
-    if not isinstance(db_config['port'], int) or db_config['port'] <= 0:
-        raise ValueError(f"{config_type} database port must be a positive integer")
-    
+    if _VALIDATED_CONFIGS.get(id(db_config)) is db_config:
+        return True
+
+    _DB_VALIDATOR(db_config, config_type)
+    _VALIDATED_CONFIGS[id(db_config)] = db_config
     return True
 
 # ====================================================================
@@ -112,9 +240,13 @@ APP_INFO = {
     'author': 'Development Team',
 }
 
+# Read-only view shared by all callers - returning it avoids copying the
+# dict on every call while still protecting APP_INFO from mutation
+_APP_INFO_VIEW = types.MappingProxyType(APP_INFO)
+
 def get_app_info():
-    """Get application information"""
-    return APP_INFO.copy()
+    """Get application information (read-only view)"""
+    return _APP_INFO_VIEW
 
 def print_version():
     """Print application version information"""
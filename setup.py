@@ -4,6 +4,7 @@ Database Sync Setup Script
 Helps initialize configuration for new projects
 """
 
+import argparse
 import os
 import sys
 import shutil
@@ -18,32 +19,75 @@ def print_warning(message):
 def print_error(message):
     print(f"❌ {message}")
 
+def copy_template(src, dst):
+    """Copy the template file using the kernel fast path when available"""
+    if hasattr(os, 'copy_file_range'):
+        # Zero-copy: data moves kernel-side without a userspace buffer.
+        # Metadata is deliberately not copied - the generated config is
+        # edited right away, so timestamps/permissions don't matter.
+        try:
+            remaining = os.stat(src).st_size
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            # The syscall can still fail at runtime (old kernel,
+            # cross-device or unsupported filesystem) - fall through to
+            # the portable copy
+            pass
+    shutil.copyfile(src, dst)
+
+def parse_args():
+    """Parse command line arguments (all optional - prompts remain the fallback)"""
+    parser = argparse.ArgumentParser(description='Initialize a config_<PROJECT>.py from the template')
+    parser.add_argument('--project', help='project name for config_<PROJECT>.py (skips the prompt)')
+    parser.add_argument('--force', action='store_true',
+                        help='overwrite an existing config file without prompting')
+    parser.add_argument('--non-interactive', action='store_true',
+                        help='never prompt; fail instead (for scripts/CI)')
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
     print("🚀 Database Sync Setup")
     print("=" * 50)
-    
+
     # Check if template exists
     if not os.path.exists('config.template.py'):
         print_error("config.template.py not found!")
         print("This script should be run from the sync_database directory.")
         sys.exit(1)
-    
-    # Ask user for project name (config_*.py is required format)
-    print("\nThis tool creates configuration files in the required 'config_*.py' format.")
-    print("Examples: config_midas.py, config_nexportal.py, config_myproject.py")
-    print()
-    
-    project_name = input("Enter project name for config_<PROJECT>.py: ").strip()
+
+    # Get project name from --project, or prompt (config_*.py is required format)
+    if args.project:
+        project_name = args.project.strip()
+    elif args.non_interactive:
+        print_error("--non-interactive requires --project NAME")
+        sys.exit(1)
+    else:
+        print("\nThis tool creates configuration files in the required 'config_*.py' format.")
+        print("Examples: config_midas.py, config_nexportal.py, config_myproject.py")
+        print()
+        project_name = input("Enter project name for config_<PROJECT>.py: ").strip()
+
     if not project_name:
         print_error("Project name cannot be empty")
         sys.exit(1)
-    
+
     # Validate project name (basic cleanup)
     project_name = project_name.lower().replace(' ', '_').replace('-', '_')
     config_file = f"config_{project_name}.py"
-    
+
     # Check if config file already exists
-    if os.path.exists(config_file):
+    if os.path.exists(config_file) and not args.force:
+        if args.non_interactive:
+            print_error(f"{config_file} already exists (use --force to overwrite)")
+            sys.exit(1)
         overwrite = input(f"\n{config_file} already exists. Overwrite? (y/N): ").strip().lower()
         if overwrite != 'y':
             print("Setup cancelled.")
@@ -51,7 +95,7 @@ def main():
     
     # Copy template to config file
     try:
-        shutil.copy2('config.template.py', config_file)
+        copy_template('config.template.py', config_file)
         print_info(f"Created {config_file} from template")
     except Exception as e:
         print_error(f"Failed to create config file: {e}")
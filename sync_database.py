@@ -28,13 +28,22 @@ Configuration:
     4. Always specify config file with --config parameter
 """
 
+import argparse
 import subprocess
 import time
 import sys
 import signal
+import json
+import re
+import tempfile
+import importlib.util
 import pymysql
 import os
-from datetime import datetime
+import queue
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 # Progress bar support (optional)
 try:
@@ -43,28 +52,44 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
+# In-process SSH tunnel support (optional) - avoids the sshpass binary
+# and the fixed tunnel_wait_time sleep; falls back to ssh when missing
+try:
+    from sshtunnel import SSHTunnelForwarder
+    SSHTUNNEL_AVAILABLE = True
+except ImportError:
+    SSHTUNNEL_AVAILABLE = False
+
 class ProgressTracker:
     """Progress tracking with tqdm fallback to simple counters"""
-    
+
+    # Slots instead of a per-instance dict: attribute access in the
+    # per-record update path is a fixed-offset load
+    __slots__ = ('total', 'current', 'description', 'use_tqdm', 'pbar', '_stride')
+
     def __init__(self, total, description="Progress", use_tqdm=True):
         self.total = total
         self.current = 0
         self.description = description
         self.use_tqdm = use_tqdm and TQDM_AVAILABLE
-        
+        # Without a terminal (cron, CI, redirected output) the \r
+        # carriage-return trick is useless and every update is a write
+        # syscall; throttle to ~100 lines over the whole run instead
+        self._stride = 1 if sys.stdout.isatty() else max(1, total // 100)
+
         if self.use_tqdm:
-            self.pbar = tqdm(total=total, desc=description, unit="items", 
+            self.pbar = tqdm(total=total, desc=description, unit="items",
                            bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]')
         else:
             self.pbar = None
             print(f"{description}: 0/{total} (0%)")
-    
+
     def update(self, n=1):
         """Update progress by n steps"""
         self.current += n
         if self.use_tqdm and self.pbar:
             self.pbar.update(n)
-        else:
+        elif self.current % self._stride == 0 or self.current >= self.total:
             # Simple counter fallback
             percentage = (self.current / self.total * 100) if self.total > 0 else 0
             print(f"\r{self.description}: {self.current}/{self.total} ({percentage:.1f}%)", end="", flush=True)
@@ -83,6 +108,110 @@ class ProgressTracker:
             # Final newline for counter mode
             print()
 
+# Config modules cached by path + mtime + size, so repeated loads (e.g.
+# a --dry-run followed by a live run driven from another script) reuse
+# the executed module instead of re-parsing an unchanged file.
+_CONFIG_MODULE_CACHE = {}
+
+def _import_config_module(module_name):
+    """Import a config module, reusing the cache while the file is unchanged"""
+    path = os.path.abspath(module_name + '.py')
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        raise ImportError(f"No module named '{module_name}' ({e})")
+
+    cache_key = (path, st.st_mtime_ns, st.st_size)
+    module = _CONFIG_MODULE_CACHE.get(cache_key)
+    if module is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None:
+        raise ImportError(f"No module named '{module_name}'")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _CONFIG_MODULE_CACHE[cache_key] = module
+    return module
+
+def _quote_identifier(name):
+    """Backtick-quote a MySQL identifier so embedded names can't break out"""
+    return '`' + name.replace('`', '``') + '`'
+
+# Secondary index lines in SHOW CREATE TABLE output, and the first
+# backticked column inside an index/FK column list
+_SECONDARY_INDEX_RE = re.compile(r'^\s*(UNIQUE KEY|KEY|FULLTEXT KEY|SPATIAL KEY)\s')
+_FK_FIRST_COL_RE = re.compile(r'FOREIGN KEY\s*\(\s*`([^`]+)`')
+_INDEX_FIRST_COL_RE = re.compile(r'\(\s*`([^`]+)`')
+
+def _split_secondary_indexes(create_statement):
+    """Split a SHOW CREATE TABLE statement into (trimmed create, index defs).
+
+    Secondary indexes are stripped from the CREATE so a bulk load doesn't
+    maintain them row by row; the returned definitions are re-added in one
+    ALTER TABLE afterwards. PRIMARY KEY stays, and for each FOREIGN KEY the
+    index on its referencing column is kept too - InnoDB requires one.
+    """
+    lines = create_statement.split('\n')
+
+    fk_first_cols = set()
+    for line in lines:
+        m = _FK_FIRST_COL_RE.search(line)
+        if m:
+            fk_first_cols.add(m.group(1))
+
+    kept = []
+    extracted = []
+    for line in lines:
+        if _SECONDARY_INDEX_RE.match(line):
+            m = _INDEX_FIRST_COL_RE.search(line)
+            if m and m.group(1) in fk_first_cols:
+                # One index per FK column is enough to satisfy InnoDB
+                fk_first_cols.discard(m.group(1))
+                kept.append(line)
+                continue
+            extracted.append(line.strip().rstrip(','))
+        else:
+            kept.append(line)
+
+    if not extracted:
+        return create_statement, []
+
+    # Removing the last body line can leave a dangling comma before ')'
+    for i in range(len(kept) - 1, -1, -1):
+        if kept[i].lstrip().startswith(')'):
+            kept[i - 1] = kept[i - 1].rstrip().rstrip(',')
+            break
+    return '\n'.join(kept), extracted
+
+# MySQL error codes checked on the write path. Integer comparison on
+# the server's error code is locale-independent and avoids formatting
+# and scanning the message for every failed row.
+_ER_DUP_ENTRY = 1062
+_FK_ERROR_CODES = frozenset({1216, 1217, 1451, 1452})
+
+def _is_fk_error(error):
+    """True if the exception is a MySQL foreign-key constraint failure"""
+    return (isinstance(error, pymysql.err.IntegrityError)
+            and error.args and error.args[0] in _FK_ERROR_CODES)
+
+def _is_duplicate_error(error):
+    """True if the exception is a MySQL duplicate-key failure"""
+    return (isinstance(error, pymysql.err.IntegrityError)
+            and error.args and error.args[0] == _ER_DUP_ENTRY)
+
+def _load_data_value(value):
+    """Serialize one value for LOAD DATA INFILE (tab-separated, backslash-escaped).
+
+    Works at the byte level so binary columns survive untouched; NULL
+    becomes \\N per the MySQL escape conventions.
+    """
+    if value is None:
+        return b'\\N'
+    raw = value if isinstance(value, bytes) else str(value).encode('utf-8')
+    return (raw.replace(b'\\', b'\\\\').replace(b'\t', b'\\t')
+               .replace(b'\n', b'\\n').replace(b'\r', b'\\r').replace(b'\0', b'\\0'))
+
 # Import configuration
 def load_config():
     """Load general config and project-specific config - MUST specify config_*.py"""
@@ -136,7 +265,7 @@ def load_config():
     
     # Load general configuration
     try:
-        general_config = __import__('config')
+        general_config = _import_config_module('config')
         print(f"✅ General configuration loaded from: config.py")
     except ImportError as e:
         print(f"❌ Error: Could not load general configuration file 'config.py'")
@@ -147,7 +276,7 @@ def load_config():
     
     # Load project-specific configuration
     try:
-        project_config = __import__(config_file)
+        project_config = _import_config_module(config_file)
         print(f"✅ Project configuration loaded from: {config_file}.py")
     except ImportError as e:
         print(f"❌ Error: Could not load project configuration file '{config_file}.py'")
@@ -165,9 +294,17 @@ def load_config():
         merged_remote_config = {**general_config.DEFAULT_DB_CONFIG, **project_config.REMOTE_DB_CONFIG}
         merged_local_config = {**general_config.DEFAULT_DB_CONFIG, **project_config.LOCAL_DB_CONFIG}
         
-        # Get table exclusions from project config
-        excluded_tables = getattr(project_config, 'EXCLUDED_TABLES', set())
-        excluded_patterns = getattr(project_config, 'EXCLUDED_PATTERNS', [])
+        # Get table exclusions from project config (prefer the pre-merged
+        # views; fall back to merging the individual collections for
+        # configs created from older templates)
+        excluded_tables = getattr(project_config, 'ALL_EXCLUDED_TABLES', None)
+        if excluded_tables is None:
+            excluded_tables = (frozenset(getattr(project_config, 'EXCLUDED_TABLES', ())) |
+                               frozenset(getattr(project_config, 'PROJECT_EXCLUDED_TABLES', ())))
+        excluded_patterns = getattr(project_config, 'ALL_EXCLUDED_PATTERNS', None)
+        if excluded_patterns is None:
+            excluded_patterns = (tuple(getattr(project_config, 'EXCLUDED_PATTERNS', ())) +
+                                 tuple(getattr(project_config, 'PROJECT_EXCLUDED_PATTERNS', ())))
         
         # Merge sync configuration
         merged_sync_config = general_config.SYNC_CONFIG.copy()
@@ -198,6 +335,20 @@ def load_config():
 SSH_CONFIG, REMOTE_DB_CONFIG, LOCAL_DB_CONFIG, EXCLUDED_TABLES, EXCLUDED_PATTERNS, SYNC_CONFIG = load_config()
 
 class DatabaseSync:
+    # Configuration is copied into slotted attributes once here, so hot
+    # paths read fixed-offset slots instead of hashing dict keys
+    __slots__ = (
+        'ssh_host', 'ssh_user', 'ssh_port', 'ssh_password', 'local_tunnel_port',
+        'remote_db_host', 'remote_db_port', 'remote_db_user', 'remote_db_password', 'remote_db_name',
+        'local_db_host', 'local_db_port', 'local_db_user', 'local_db_password', 'local_db_name',
+        'excluded_tables', 'excluded_patterns', 'tunnel_process', '_tunnel_forwarder',
+        'stats', '_stats_lock', '_log_buffer', '_log_lock', '_log_last_flush',
+        '_setup_remote_conn', '_local_tables',
+        '_pk_cache', '_columns_cache', '_create_stmt_cache', '_meta_lock', '_is_excluded',
+        '_remote_table_status', '_sync_manifest', '_local_infile', '_max_packet',
+        '_disable_fk', '_connect_timeout', '_read_timeout', '_write_timeout'
+    )
+
     def __init__(self):
         print("🚀 Database Sync - Portable Version")
         print("=" * 60)
@@ -224,9 +375,17 @@ class DatabaseSync:
         self.local_db_name = LOCAL_DB_CONFIG['database']
         
         # Sync configuration
-        self.excluded_tables = EXCLUDED_TABLES.copy()  # Create a copy to allow modifications
-        self.excluded_patterns = EXCLUDED_PATTERNS.copy()
+        self.excluded_tables = set(EXCLUDED_TABLES)  # Create a copy to allow modifications
+        self.excluded_patterns = list(EXCLUDED_PATTERNS)
+
+        # Compile the exclusion filters once: each table name is then
+        # checked with one hash probe plus one C-level regex scan instead
+        # of a Python loop over every pattern
+        import config as general_config
+        self._is_excluded = general_config.build_exclusion_matcher(
+            frozenset(self.excluded_tables), tuple(self.excluded_patterns))
         self.tunnel_process = None
+        self._tunnel_forwarder = None
         
         # Statistics tracking
         self.stats = {
@@ -239,23 +398,91 @@ class DatabaseSync:
             'errors': 0,
             'skipped': 0
         }
-        
+        self._stats_lock = threading.Lock()
+        self._log_buffer = []
+        self._log_lock = threading.Lock()
+        self._log_last_flush = time.monotonic()
+        self._setup_remote_conn = None
+        self._local_tables = None
+
+        # Hoisted SYNC_CONFIG values: these are consulted per connection
+        # or per table, and never change after startup (unlike
+        # use_drop_recreate_mode, which --drop-recreate can flip later)
+        self._disable_fk = SYNC_CONFIG.get('disable_foreign_key_checks', True)
+        self._connect_timeout = SYNC_CONFIG.get('connection_timeout', 60)
+        self._read_timeout = SYNC_CONFIG.get('mysql_read_timeout', 120)
+        self._write_timeout = SYNC_CONFIG.get('mysql_write_timeout', 120)
+
+        # Per-run remote metadata caches (see get_table_primary_key /
+        # get_table_create_statement)
+        self._pk_cache = None
+        self._columns_cache = None
+        self._create_stmt_cache = {}
+        self._remote_table_status = None
+        self._sync_manifest = self._load_sync_manifest()
+        self._local_infile = None
+        self._max_packet = None
+        self._meta_lock = threading.Lock()
+
         # Print configuration summary
         self.log(f"Configuration loaded: {self.remote_db_name}@{self.remote_db_host} -> {self.local_db_name}@{self.local_db_host}")
         
+    def bump_stat(self, name, n=1):
+        """Increment a statistics counter (thread-safe for parallel sync)"""
+        with self._stats_lock:
+            self.stats[name] += n
+
+    # Class-level so every instance shares one table; colors never change
+    _LOG_COLORS = {
+        "INFO": "\033[0;32m",    # Green
+        "WARNING": "\033[1;33m", # Yellow
+        "ERROR": "\033[0;31m",   # Red
+        "SUCCESS": "\033[1;32m"  # Bright Green
+    }
+
+    # (whole-second, formatted) timestamp shared by all instances; log
+    # timestamps have second granularity, so bursts of lines within the
+    # same second reuse one formatted string instead of reformatting
+    _ts_cache = (0, "")
+
+    def _timestamp(self):
+        now = int(time.time())
+        cached = DatabaseSync._ts_cache
+        if cached[0] != now:
+            cached = (now, time.strftime("%H:%M:%S"))
+            DatabaseSync._ts_cache = cached
+        return cached[1]
+
     def log(self, message, level="INFO"):
-        """Log message with timestamp and color"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        colors = {
-            "INFO": "\033[0;32m",    # Green
-            "WARNING": "\033[1;33m", # Yellow
-            "ERROR": "\033[0;31m",   # Red
-            "SUCCESS": "\033[1;32m"  # Bright Green
-        }
-        color = colors.get(level, "\033[0m")
-        reset = "\033[0m"
-        print(f"{color}[{timestamp}] {level}: {message}{reset}")
-        
+        """Log message with timestamp and color.
+
+        INFO lines are buffered and written in batches so the hot path
+        doesn't pay a stdout syscall per line; warnings and errors flush
+        immediately so problems surface in order and on time.
+        """
+        timestamp = self._timestamp()
+        color = self._LOG_COLORS.get(level, "\033[0m")
+        line = f"{color}[{timestamp}] {level}: {message}\033[0m"
+        with self._log_lock:
+            self._log_buffer.append(line)
+            if (level != "INFO" or len(self._log_buffer) >= 50
+                    or time.monotonic() - self._log_last_flush >= 0.5):
+                self._flush_logs_locked()
+
+    def _flush_logs_locked(self):
+        """Write buffered log lines; caller must hold _log_lock"""
+        if self._log_buffer:
+            sys.stdout.write("\n".join(self._log_buffer) + "\n")
+            sys.stdout.flush()
+            self._log_buffer.clear()
+        self._log_last_flush = time.monotonic()
+
+    def flush_logs(self):
+        """Flush any buffered log output (run boundaries, shutdown)"""
+        with self._log_lock:
+            self._flush_logs_locked()
+
+
     def check_dependencies(self):
         """Check if required dependencies are available"""
         try:
@@ -264,13 +491,15 @@ class DatabaseSync:
             self.log("PyMySQL not found. Install with: pip install pymysql", "ERROR")
             return False
             
-        # Check if sshpass is available
-        try:
-            subprocess.run(["sshpass", "-V"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.log("sshpass not found. Install with: brew install sshpass (macOS) or apt-get install sshpass (Linux)", "ERROR")
-            return False
-            
+        # sshpass is only needed for the subprocess tunnel fallback
+        if not SSHTUNNEL_AVAILABLE:
+            try:
+                subprocess.run(["sshpass", "-V"], capture_output=True, check=True)
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                self.log("sshpass not found. Install with: brew install sshpass (macOS) or apt-get install sshpass (Linux)", "ERROR")
+                self.log("Alternatively: pip install sshtunnel (in-process tunnel, no sshpass needed)", "ERROR")
+                return False
+
         return True
         
     def create_ssh_tunnel(self):
@@ -281,18 +510,44 @@ class DatabaseSync:
         
         # Close any existing tunnel
         self.close_tunnel()
-        
+
+        # Prefer the in-process forwarder: no external binaries, SSH
+        # compression built in, and start() returns once the listener is
+        # actually ready instead of sleeping a fixed tunnel_wait_time
+        if SSHTUNNEL_AVAILABLE:
+            try:
+                self._tunnel_forwarder = SSHTunnelForwarder(
+                    (self.ssh_host, self.ssh_port),
+                    ssh_username=self.ssh_user,
+                    ssh_password=self.ssh_password,
+                    remote_bind_address=(self.remote_db_host, self.remote_db_port),
+                    local_bind_address=('127.0.0.1', self.local_tunnel_port),
+                    compression=True,
+                )
+                self._tunnel_forwarder.start()
+                self.log("SSH tunnel established successfully (in-process)", "SUCCESS")
+                return True
+            except Exception as e:
+                self._tunnel_forwarder = None
+                self.log(f"In-process SSH tunnel failed ({e}), falling back to ssh", "WARNING")
+
         # SSH tunnel command
         cmd = [
             "sshpass", "-p", self.ssh_password,
-            "ssh", "-N",  # Don't execute remote command
+            "ssh", "-N", "-C",  # No remote command; compress the tunnel stream
             "-L", f"{self.local_tunnel_port}:{self.remote_db_host}:{self.remote_db_port}",
             "-p", str(self.ssh_port),
             f"{self.ssh_user}@{self.ssh_host}",
             "-o", "StrictHostKeyChecking=no",
             "-o", "UserKnownHostsFile=/dev/null",
             "-o", "ServerAliveInterval=60",
-            "-o", "ServerAliveCountMax=3"
+            "-o", "ServerAliveCountMax=3",
+            # Multiplex over a persistent control socket: frequent/cron
+            # runs skip the key exchange + auth handshake as long as the
+            # cached master from a previous run is still alive
+            "-o", "ControlMaster=auto",
+            "-o", "ControlPath=/tmp/syncdb-%r@%h:%p",
+            "-o", "ControlPersist=600"
         ]
         
         try:
@@ -300,23 +555,282 @@ class DatabaseSync:
                 cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
             )
             
-            # Wait for tunnel to establish and test it
+            # Probe the local forward port until it accepts connections
+            # instead of sleeping a fixed tunnel_wait_time - the tunnel is
+            # usually up in well under a second, and tunnel_wait_time only
+            # serves as the deadline for slow links
             tunnel_wait_time = SYNC_CONFIG.get('tunnel_wait_time', 5)
-            self.log(f"Waiting {tunnel_wait_time} seconds for tunnel to stabilize...")
-            time.sleep(tunnel_wait_time)
-            
-            if self.tunnel_process.poll() is None:
-                self.log("SSH tunnel established successfully", "SUCCESS")
-                return True
-            else:
-                stderr = self.tunnel_process.stderr.read()
-                self.log(f"SSH tunnel failed: {stderr}", "ERROR")
-                return False
+            deadline = time.monotonic() + tunnel_wait_time
+            delay = 0.05
+            while True:
+                if self.tunnel_process.poll() is not None:
+                    stderr = self.tunnel_process.stderr.read()
+                    self.log(f"SSH tunnel failed: {stderr}", "ERROR")
+                    return False
+                try:
+                    probe = socket.create_connection(
+                        ('127.0.0.1', self.local_tunnel_port), timeout=0.5)
+                    probe.close()
+                    self.log("SSH tunnel established successfully", "SUCCESS")
+                    return True
+                except OSError:
+                    pass
+                if time.monotonic() >= deadline:
+                    self.log(f"SSH tunnel not ready after {tunnel_wait_time}s", "ERROR")
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 0.8)
                 
         except Exception as e:
             self.log(f"Failed to create SSH tunnel: {e}", "ERROR")
             return False
     
+    def _probe_direct(self, timeout=0.5):
+        """Check whether the remote database port accepts a direct TCP connection"""
+        try:
+            probe = socket.create_connection(
+                (self.remote_db_host, self.remote_db_port), timeout=timeout)
+            probe.close()
+            return True
+        except OSError:
+            return False
+
+    def _connect_local(self):
+        """Open a connection to the local database"""
+        return pymysql.connect(
+            host=self.local_db_host, port=self.local_db_port,
+            user=self.local_db_user, password=self.local_db_password,
+            database=self.local_db_name, charset='utf8mb4',
+            autocommit=False, local_infile=True
+        )
+
+    def _local_infile_enabled(self, local_conn):
+        """Check (once per run) whether the local server accepts LOAD DATA LOCAL"""
+        if self._local_infile is None:
+            try:
+                with local_conn.cursor() as cursor:
+                    cursor.execute("SELECT @@local_infile")
+                    self._local_infile = bool(cursor.fetchone()[0])
+            except Exception:
+                self._local_infile = False
+        return self._local_infile
+
+    def _get_max_allowed_packet(self, connection):
+        """Fetch the local server's max_allowed_packet once per run"""
+        if self._max_packet is None:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SHOW VARIABLES LIKE 'max_allowed_packet'")
+                    row = cursor.fetchone()
+                    self._max_packet = int(row[1]) if row else 4 * 1024 * 1024
+            except Exception:
+                self._max_packet = 4 * 1024 * 1024
+        return self._max_packet
+
+    def _adaptive_batch_size(self, connection, sample_row, default=1000):
+        """Pick a multi-row INSERT batch size targeting ~70% of max_allowed_packet.
+
+        An explicit SYNC_CONFIG['batch_size'] wins; otherwise the first
+        fetched row is sampled to estimate bytes per row, so narrow
+        tables get large batches and wide/blob tables stay under the
+        packet limit.
+        """
+        configured = SYNC_CONFIG.get('batch_size', 0)
+        if configured:
+            return configured
+        if not sample_row:
+            return default
+        avg_row_bytes = max(1, int(sum(len(str(v)) for v in sample_row) * 1.2))
+        max_packet = self._get_max_allowed_packet(connection)
+        return max(100, min(50000, int(max_packet * 0.7 / avg_row_bytes)))
+
+    def _load_data_from_cursor(self, cursor, table_name, column_names, remote_cursor, record_progress):
+        """Bulk-load streamed remote rows via LOAD DATA LOCAL INFILE.
+
+        Rows are spooled to a temporary TSV and handed to the server's
+        bulk loader in one statement, bypassing SQL parsing entirely.
+        """
+        inserted_count = 0
+        with tempfile.NamedTemporaryFile('wb', suffix='.tsv') as tsv:
+            while True:
+                rows = remote_cursor.fetchmany(10000)
+                if not rows:
+                    break
+                tsv.writelines(b"\t".join(map(_load_data_value, row)) + b"\n"
+                               for row in rows)
+                inserted_count += len(rows)
+                record_progress.update(len(rows))
+            tsv.flush()
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {_quote_identifier(table_name)} "
+                f"CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                f"LINES TERMINATED BY '\\n' ({column_names})",
+                (tsv.name,)
+            )
+        return inserted_count
+
+    def _remote_conn_kwargs(self, use_direct=False):
+        """Connection arguments for the remote database (direct or tunneled)"""
+        if use_direct:
+            host, port = self.remote_db_host, self.remote_db_port
+        else:
+            host, port = 'localhost', self.local_tunnel_port
+        return dict(
+            host=host, port=port,
+            user=self.remote_db_user, password=self.remote_db_password,
+            database=self.remote_db_name, charset='utf8mb4',
+            connect_timeout=self._connect_timeout,
+            read_timeout=self._read_timeout,
+            write_timeout=self._write_timeout,
+            autocommit=False
+        )
+
+    def _take_setup_remote_conn(self):
+        """Take the remote connection kept open from the setup phase, if any.
+
+        The connection is pinged before handing it out; a dead one (tunnel
+        hiccup, server-side timeout) is discarded so the caller falls back
+        to a fresh connect.
+        """
+        conn = self._setup_remote_conn
+        if conn is None:
+            return None
+        self._setup_remote_conn = None
+        try:
+            conn.ping(reconnect=False)
+            return conn
+        except Exception:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            return None
+
+    def _connect_remote(self, use_direct=False):
+        """Open a connection to the remote database (direct or via SSH tunnel)"""
+        # Reuse the connection verified during the setup phase instead of
+        # paying another TCP+auth handshake through the tunnel
+        conn = self._take_setup_remote_conn()
+        if conn is None:
+            conn = pymysql.connect(**self._remote_conn_kwargs(use_direct))
+        # Pin the session to one InnoDB MVCC snapshot: every table, and
+        # the checksum pass vs the changed-row fetch within a table, sees
+        # the same committed state even while the remote keeps writing.
+        # Read-only, so dropping it on close costs nothing.
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SET SESSION TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        except Exception as e:
+            self.log(f"Could not pin remote snapshot: {e}", "WARNING")
+        return conn
+
+    def _pipelined_batches(self, remote_cursor, batch_size):
+        """Yield fetched batches while a background thread keeps fetching.
+
+        A bounded queue buffers a few batches ahead so the remote read
+        (socket I/O, GIL released) overlaps the local write round-trips
+        instead of alternating with them.
+        """
+        batches = queue.Queue(maxsize=4)
+        stop = threading.Event()
+
+        def producer():
+            try:
+                while not stop.is_set():
+                    rows = remote_cursor.fetchmany(batch_size)
+                    while not stop.is_set():
+                        try:
+                            batches.put(rows, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    if not rows:
+                        return
+            except Exception as e:
+                # Same retry loop as data batches: the error must reach
+                # the consumer even if the queue is full right now (the
+                # finally drain wakes a blocked put on shutdown)
+                while not stop.is_set():
+                    try:
+                        batches.put(e, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+
+        thread = threading.Thread(target=producer, daemon=True)
+        thread.start()
+        try:
+            while True:
+                rows = batches.get()
+                if isinstance(rows, Exception):
+                    raise rows
+                if not rows:
+                    return
+                yield rows
+        finally:
+            # If the consumer bails mid-copy (write error, generator
+            # closed), the producer must stop touching the cursor before
+            # the caller's with-block closes it - racing fetches would
+            # corrupt the shared connection's protocol state. Signal it,
+            # drain the queue so a blocked put() wakes, and wait it out.
+            stop.set()
+            while thread.is_alive():
+                try:
+                    batches.get_nowait()
+                except queue.Empty:
+                    pass
+                thread.join(timeout=0.05)
+
+    def _prepare_local_session(self, local_conn):
+        """Relax per-row constraint checking for an incremental sync session.
+
+        Rows are copied from a database that already enforces the same
+        constraints, so per-row FK index probes and unique checks are
+        redundant. Session-scoped: the settings die with the connection.
+        """
+        if SYNC_CONFIG.get('disable_fk_during_incremental', True):
+            with local_conn.cursor() as cursor:
+                cursor.execute("SET SESSION foreign_key_checks = 0")
+                cursor.execute("SET SESSION unique_checks = 0")
+
+    def _sync_tables_parallel(self, tables, use_direct, dry_run, workers):
+        """Sync independent tables concurrently over a pool of connection pairs.
+
+        Each worker borrows a (local, remote) connection pair from a queue;
+        the GIL is released during socket I/O, so network-bound tables
+        overlap. Foreign key checks are disabled per session because table
+        order is no longer guaranteed.
+        """
+        workers = min(workers, len(tables))
+        pairs = queue.Queue()
+        for _ in range(workers):
+            local_conn = self._connect_local()
+            remote_conn = self._connect_remote(use_direct)
+            self._prepare_local_session(local_conn)
+            pairs.put((local_conn, remote_conn))
+
+        table_progress = ProgressTracker(len(tables), "Syncing tables")
+
+        def sync_one(table):
+            pair = pairs.get()
+            try:
+                self.sync_table(table, pair[0], pair[1], dry_run)
+            finally:
+                pairs.put(pair)
+                table_progress.update(1)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(sync_one, tables))
+        finally:
+            table_progress.close()
+            while not pairs.empty():
+                local_conn, remote_conn = pairs.get()
+                local_conn.close()
+                remote_conn.close()
+
     def test_connections_method(self, use_direct=False):
         """Test both local and remote database connections with specified method"""
         self.log("Testing database connections...")
@@ -342,27 +856,8 @@ class DatabaseSync:
         
         # Test remote connection
         try:
-            if use_direct:
-                remote_conn = pymysql.connect(
-                    host=self.remote_db_host, port=self.remote_db_port,
-                    user=self.remote_db_user, password=self.remote_db_password,
-                    database=self.remote_db_name, charset='utf8mb4',
-                    connect_timeout=SYNC_CONFIG.get('connection_timeout', 60),
-                    read_timeout=SYNC_CONFIG.get('mysql_read_timeout', 120),
-                    write_timeout=SYNC_CONFIG.get('mysql_write_timeout', 120),
-                    autocommit=False
-                )
-            else:
-                remote_conn = pymysql.connect(
-                    host='localhost', port=self.local_tunnel_port,
-                    user=self.remote_db_user, password=self.remote_db_password,
-                    database=self.remote_db_name, charset='utf8mb4',
-                    connect_timeout=SYNC_CONFIG.get('connection_timeout', 60),
-                    read_timeout=SYNC_CONFIG.get('mysql_read_timeout', 120),
-                    write_timeout=SYNC_CONFIG.get('mysql_write_timeout', 120),
-                    autocommit=False
-                )
-            
+            remote_conn = pymysql.connect(**self._remote_conn_kwargs(use_direct))
+
             with remote_conn.cursor() as cursor:
                 # Test basic connection
                 self.log(f"Testing remote connection to {self.remote_db_name}...")
@@ -378,10 +873,12 @@ class DatabaseSync:
                 cursor.execute("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = %s", (self.remote_db_name,))
                 remote_tables = cursor.fetchone()[0]
             
-            remote_conn.close()
+            # Keep the verified connection for the next setup step (table
+            # listing, then the sync itself) instead of closing it
+            self._setup_remote_conn = remote_conn
             connection_type = "Direct" if use_direct else "Tunnel"
             self.log(f"✅ Remote database ({connection_type}): {remote_tables} tables, MySQL {version}")
-            
+
             return True
             
         except Exception as e:
@@ -425,60 +922,52 @@ class DatabaseSync:
             return {}, {}
     
     def get_optimal_sync_order(self, tables, dependencies):
-        """Determine optimal sync order based on foreign key dependencies"""
-        # Use topological sort to order tables by dependencies
+        """Determine optimal sync order based on foreign key dependencies.
+
+        Kahn's algorithm: iterative (no recursion limit on deep FK
+        chains), deterministic (ready tables drain in sorted order), and
+        cycles fall out naturally as the tables left with unresolved
+        dependencies. Self-referencing tables are not a cycle - the FK
+        just points at rows of the same table.
+        """
+        table_set = set(tables)
+        in_degree = {table: 0 for table in tables}
+        dependents = {}
+        for table in tables:
+            for dep in dependencies.get(table, ()):
+                if dep in table_set and dep != table:
+                    in_degree[table] += 1
+                    dependents.setdefault(dep, []).append(table)
+
+        ready = sorted(table for table in tables if in_degree[table] == 0)
         sync_order = []
-        visited = set()
-        temp_visited = set()
-        
-        def visit(table):
-            if table in temp_visited:
-                # Circular dependency detected - log warning but continue
-                self.log(f"⚠️  Circular dependency detected for table: {table}", "WARNING")
-                return
-            if table in visited:
-                return
-                
-            temp_visited.add(table)
-            
-            # Visit dependencies first
-            if table in dependencies:
-                for dep in dependencies[table]:
-                    if dep in tables:  # Only visit if dependency is in our sync list
-                        visit(dep)
-            
-            temp_visited.remove(table)
-            visited.add(table)
+        while ready:
+            table = ready.pop(0)
             sync_order.append(table)
-        
-        for table in tables:
-            if table not in visited:
-                visit(table)
-        
+            newly_ready = []
+            for dependent in dependents.get(table, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    newly_ready.append(dependent)
+            if newly_ready:
+                ready.extend(sorted(newly_ready))
+
+        # Anything left sits on a dependency cycle - warn and append so
+        # every table still gets synced (FK errors there are handled)
+        remaining = sorted(table for table in tables if in_degree[table] > 0)
+        for table in remaining:
+            self.log(f"⚠️  Circular dependency detected for table: {table}", "WARNING")
+        sync_order.extend(remaining)
+
         return sync_order
     
     def get_sync_tables_method(self, use_direct=False):
         """Get list of tables to sync with specified connection method"""
         try:
-            if use_direct:
-                remote_conn = pymysql.connect(
-                    host=self.remote_db_host, port=self.remote_db_port,
-                    user=self.remote_db_user, password=self.remote_db_password,
-                    database=self.remote_db_name, charset='utf8mb4',
-                    connect_timeout=SYNC_CONFIG.get('connection_timeout', 60),
-                    read_timeout=SYNC_CONFIG.get('mysql_read_timeout', 120),
-                    write_timeout=SYNC_CONFIG.get('mysql_write_timeout', 120)
-                )
-            else:
-                remote_conn = pymysql.connect(
-                    host='localhost', port=self.local_tunnel_port,
-                    user=self.remote_db_user, password=self.remote_db_password,
-                    database=self.remote_db_name, charset='utf8mb4',
-                    connect_timeout=SYNC_CONFIG.get('connection_timeout', 60),
-                    read_timeout=SYNC_CONFIG.get('mysql_read_timeout', 120),
-                    write_timeout=SYNC_CONFIG.get('mysql_write_timeout', 120)
-                )
-            
+            remote_conn = self._take_setup_remote_conn()
+            if remote_conn is None:
+                remote_conn = pymysql.connect(**self._remote_conn_kwargs(use_direct))
+
             with remote_conn.cursor() as cursor:
                 cursor.execute("SHOW TABLES")
                 all_tables = [row[0] for row in cursor.fetchall()]
@@ -488,26 +977,18 @@ class DatabaseSync:
             excluded_count = 0
             
             for table in all_tables:
-                # Skip if in excluded list
-                if table in self.excluded_tables:
-                    excluded_count += 1
-                    continue
-                
-                # Skip if starts with excluded pattern or contains 'copy'
-                if any(table.startswith(pattern) for pattern in self.excluded_patterns if pattern != 'copy'):
+                # Skip excluded names, excluded prefixes, and 'copy' tables
+                # (compiled matcher - see build_exclusion_matcher in config.py)
+                if self._is_excluded(table):
                     excluded_count += 1
                     continue
-                
-                # Skip if contains 'copy' anywhere in the name
-                if 'copy' in table.lower():
-                    excluded_count += 1
-                    continue
-                
+
                 sync_tables.append(table)
             
             # Get foreign key dependencies and determine optimal sync order
             dependencies, reverse_deps = self.get_foreign_key_dependencies(remote_conn)
-            remote_conn.close()
+            # Hand the connection back for the sync phase to pick up
+            self._setup_remote_conn = remote_conn
             
             # Determine sync order based on configuration
             sync_order_strategy = SYNC_CONFIG.get('sync_order_strategy', 'dependency')
@@ -539,30 +1020,160 @@ class DatabaseSync:
             self.log(f"Failed to get table list: {e}", "ERROR")
             return []
     
+    def _fetch_primary_keys(self, connection):
+        """Fetch primary key columns for every remote table in one query"""
+        pk_map = {}
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT TABLE_NAME, COLUMN_NAME
+                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+                WHERE TABLE_SCHEMA = %s
+                AND CONSTRAINT_NAME = 'PRIMARY'
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """, (self.remote_db_name,))
+            for table, column in cursor.fetchall():
+                pk_map.setdefault(table, []).append(column)
+        return pk_map
+
     def get_table_primary_key(self, table_name, connection):
-        """Get primary key columns for a table"""
+        """Get primary key columns for a table.
+
+        Primary keys for the whole schema are bulk-fetched on the first
+        call and served from cache afterwards - one round-trip per run
+        instead of one per table.
+        """
         try:
-            with connection.cursor() as cursor:
-                cursor.execute(f"""
-                    SELECT COLUMN_NAME 
-                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE 
-                    WHERE TABLE_SCHEMA = '{self.remote_db_name}' 
-                    AND TABLE_NAME = '{table_name}' 
-                    AND CONSTRAINT_NAME = 'PRIMARY'
-                    ORDER BY ORDINAL_POSITION
-                """)
-                return [row[0] for row in cursor.fetchall()]
+            with self._meta_lock:
+                if self._pk_cache is None:
+                    self._pk_cache = self._fetch_primary_keys(connection)
+                return self._pk_cache.get(table_name, [])
         except Exception as e:
             self.log(f"Failed to get primary key for {table_name}: {e}", "ERROR")
             return []
-    
+
+    def _fetch_columns(self, connection):
+        """Fetch the ordered column list for every remote table in one query"""
+        col_map = {}
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT TABLE_NAME, COLUMN_NAME
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = %s
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """, (self.remote_db_name,))
+            for table, column in cursor.fetchall():
+                col_map.setdefault(table, []).append(column)
+        return col_map
+
+    def get_table_columns(self, table_name, connection):
+        """Get the ordered column list for a table.
+
+        Like primary keys, columns for the whole schema are bulk-fetched
+        on the first call and served from cache afterwards.
+        """
+        try:
+            with self._meta_lock:
+                if self._columns_cache is None:
+                    self._columns_cache = self._fetch_columns(connection)
+                return self._columns_cache.get(table_name, [])
+        except Exception as e:
+            self.log(f"Failed to get columns for {table_name}: {e}", "ERROR")
+            return []
+
+    def iter_row_checksums(self, table_name, connection, pk_columns, columns):
+        """Stream (pk, CRC32 checksum) pairs in primary-key order.
+
+        The server hashes each row with CRC32(CONCAT_WS(...)), so only a
+        few bytes per row cross the wire instead of the full row. NULLs
+        are folded to CHAR(0) so they stay distinct from empty strings
+        (CONCAT_WS silently skips NULL arguments). ORDER BY pk lets two
+        sides be diffed with a linear merge-join in O(batch) memory.
+        """
+        pk_names = ", ".join(_quote_identifier(col) for col in pk_columns)
+        checksum_expr = "CRC32(CONCAT_WS(0x1F, %s))" % ", ".join(
+            f"IFNULL({_quote_identifier(col)}, CHAR(0))" for col in columns
+        )
+        single_pk = len(pk_columns) == 1
+        with connection.cursor(pymysql.cursors.SSCursor) as cursor:
+            cursor.execute(f"SELECT {pk_names}, {checksum_expr} "
+                           f"FROM {_quote_identifier(table_name)} ORDER BY {pk_names}")
+            while True:
+                rows = cursor.fetchmany(50000)
+                if not rows:
+                    break
+                if single_pk:
+                    for row in rows:
+                        yield row[0], row[1]
+                else:
+                    for row in rows:
+                        yield row[:-1], row[-1]
+
+    def _manifest_path(self):
+        """Path of the per-database sync manifest"""
+        return os.path.join('.sync_state', f"{self.remote_db_name}.json")
+
+    def _load_sync_manifest(self):
+        """Load remote table status recorded by the previous successful run"""
+        try:
+            with open(self._manifest_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_sync_manifest(self):
+        """Persist remote table status so the next run can skip unchanged tables"""
+        try:
+            os.makedirs('.sync_state', exist_ok=True)
+            with open(self._manifest_path(), 'w') as f:
+                json.dump(self._sync_manifest, f, indent=2, sort_keys=True)
+        except OSError as e:
+            self.log(f"Could not write sync manifest: {e}", "WARNING")
+
+    def _fetch_remote_table_status(self, connection):
+        """Fetch (update_time, approx rows) for every remote table in one query"""
+        status = {}
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT TABLE_NAME, UPDATE_TIME, TABLE_ROWS
+                FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = %s
+            """, (self.remote_db_name,))
+            for table, update_time, rows in cursor.fetchall():
+                status[table] = {
+                    'update_time': str(update_time) if update_time else None,
+                    'rows': rows,
+                }
+        return status
+
+    def get_remote_table_status(self, table_name, connection):
+        """Get a table's remote status (bulk-fetched and cached per run)"""
+        try:
+            with self._meta_lock:
+                if self._remote_table_status is None:
+                    self._remote_table_status = self._fetch_remote_table_status(connection)
+                return self._remote_table_status.get(table_name)
+        except Exception as e:
+            self.log(f"Failed to get table status for {table_name}: {e}", "ERROR")
+            return None
+
     def get_table_create_statement(self, table_name, connection):
-        """Get CREATE TABLE statement for a table from remote database"""
+        """Get CREATE TABLE statement for a table from remote database.
+
+        SHOW CREATE TABLE has no bulk form, so results are fetched
+        lazily and memoized per run.
+        """
+        with self._meta_lock:
+            cached = self._create_stmt_cache.get(table_name)
+        if cached is not None:
+            return cached
+
         try:
             with connection.cursor() as cursor:
-                cursor.execute(f"SHOW CREATE TABLE `{table_name}`")
+                cursor.execute(f"SHOW CREATE TABLE {_quote_identifier(table_name)}")
                 result = cursor.fetchone()
                 if result:
+                    with self._meta_lock:
+                        self._create_stmt_cache[table_name] = result[1]
                     return result[1]  # The CREATE TABLE statement
                 return None
         except Exception as e:
@@ -570,15 +1181,23 @@ class DatabaseSync:
             return None
     
     def table_exists_locally(self, table_name, local_conn):
-        """Check if a table exists in the local database"""
+        """Check if a table exists in the local database.
+
+        The local table list is fetched once and checked as a set - one
+        round-trip per run instead of one COUNT(*) per table. Tables this
+        run creates are added to the set as they appear.
+        """
         try:
-            with local_conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM information_schema.tables 
-                    WHERE table_schema = %s AND table_name = %s
-                """, (self.local_db_name, table_name))
-                return cursor.fetchone()[0] > 0
+            with self._meta_lock:
+                if self._local_tables is None:
+                    with local_conn.cursor() as cursor:
+                        cursor.execute("""
+                            SELECT TABLE_NAME
+                            FROM information_schema.tables
+                            WHERE table_schema = %s
+                        """, (self.local_db_name,))
+                        self._local_tables = {row[0] for row in cursor.fetchall()}
+                return table_name in self._local_tables
         except Exception as e:
             self.log(f"Failed to check if table {table_name} exists locally: {e}", "ERROR")
             return False
@@ -594,7 +1213,7 @@ class DatabaseSync:
             
             # Get record count from remote for logging
             with remote_conn.cursor() as cursor:
-                cursor.execute(f"SELECT COUNT(*) FROM `{table_name}`")
+                cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(table_name)}")
                 remote_count = cursor.fetchone()[0]
             
             self.log(f"🆕 {table_name}: Creating new table (will contain {remote_count:,} records)")
@@ -606,106 +1225,230 @@ class DatabaseSync:
                 # Create table with remote structure
                 cursor.execute(create_statement)
                 self.log(f"  ✅ Created table {table_name} with remote schema")
-                self.stats['tables_created'] += 1
-                
+                self.bump_stat('tables_created')
+
             local_conn.commit()
+            with self._meta_lock:
+                if self._local_tables is not None:
+                    self._local_tables.add(table_name)
             return True
             
         except Exception as e:
             self.log(f"❌ Error creating table {table_name}: {e}", "ERROR")
-            self.stats['errors'] += 1
+            self.bump_stat('errors')
             if not dry_run:
                 local_conn.rollback()
             return False
     
+    def _mysqldump_copy_table(self, table_name):
+        """Stream one table from remote to local via mysqldump | mysql.
+
+        Rows never enter Python: mysqldump on the SSH host emits the
+        DROP/CREATE plus multi-row INSERTs (--extended-insert) and the
+        local mysql client applies them directly. Returns True on
+        success, False if the pipeline is unavailable or failed so the
+        caller can fall back to the driver-level copy.
+        """
+        dump_cmd = [
+            "sshpass", "-p", self.ssh_password,
+            "ssh", "-p", str(self.ssh_port),
+            "-o", "StrictHostKeyChecking=no",
+            "-o", "UserKnownHostsFile=/dev/null",
+            f"{self.ssh_user}@{self.ssh_host}",
+            "mysqldump",
+            "-h", self.remote_db_host, "-P", str(self.remote_db_port),
+            "-u", self.remote_db_user, f"-p{self.remote_db_password}",
+            "--single-transaction", "--quick", "--extended-insert",
+            "--skip-lock-tables", "--no-create-db",
+            self.remote_db_name, table_name,
+        ]
+        load_cmd = [
+            "mysql",
+            "-h", self.local_db_host, "-P", str(self.local_db_port),
+            "-u", self.local_db_user, f"-p{self.local_db_password}",
+            self.local_db_name,
+        ]
+
+        try:
+            dump_proc = subprocess.Popen(dump_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            load_proc = subprocess.Popen(load_cmd, stdin=dump_proc.stdout, stderr=subprocess.PIPE)
+            dump_proc.stdout.close()  # mysqldump gets SIGPIPE if mysql dies
+            load_err = load_proc.communicate()[1]
+            dump_err = dump_proc.communicate()[1]
+
+            if dump_proc.returncode != 0 or load_proc.returncode != 0:
+                err = (dump_err or load_err or b'').decode(errors='replace').strip()
+                self.log(f"mysqldump pipe failed for {table_name}: {err}", "WARNING")
+                return False
+            return True
+
+        except FileNotFoundError as e:
+            self.log(f"mysqldump pipe unavailable ({e}); using driver copy", "WARNING")
+            return False
+
     def drop_recreate_table(self, table_name, local_conn, remote_conn, dry_run=False):
         """Drop and recreate a table with fresh data from remote"""
         try:
+            # Indexes split out of the CREATE but not yet rebuilt; DDL
+            # commits implicitly, so if the load fails these must still
+            # be added back on the error path
+            pending_indexes = []
             # Get the CREATE TABLE statement from remote
             create_statement = self.get_table_create_statement(table_name, remote_conn)
             if not create_statement:
                 self.log(f"⚠️  Skipping {table_name}: Could not get CREATE statement", "WARNING")
-                self.stats['skipped'] += 1
+                self.bump_stat('skipped')
                 return
             
             # Get record count from remote
             with remote_conn.cursor() as cursor:
-                cursor.execute(f"SELECT COUNT(*) FROM `{table_name}`")
+                cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(table_name)}")
                 remote_count = cursor.fetchone()[0]
             
             self.log(f"🔄 {table_name}: Will drop/recreate with {remote_count:,} records")
-            
+
             if dry_run:
                 return
-            
+
+            # Optional fast path: let the servers stream the copy directly
+            # instead of round-tripping every row through Python
+            if SYNC_CONFIG.get('use_mysqldump_pipe', False):
+                if self._mysqldump_copy_table(table_name):
+                    self.log(f"  ✅ Streamed {remote_count:,} records into {table_name} via mysqldump")
+                    self.bump_stat('tables_dropped')
+                    self.bump_stat('tables_created')
+                    self.bump_stat('records_inserted', remote_count)
+                    self.bump_stat('tables_synced')
+                    return
+                # Pipe failed - fall through to the driver-level copy
+
             with local_conn.cursor() as cursor:
                 # Disable foreign key checks if configured
-                if SYNC_CONFIG.get('disable_foreign_key_checks', True):
+                if self._disable_fk:
                     cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
                 
                 # Drop table if it exists
-                cursor.execute(f"DROP TABLE IF EXISTS `{table_name}`")
+                cursor.execute(f"DROP TABLE IF EXISTS {_quote_identifier(table_name)}")
                 self.log(f"  ✅ Dropped table {table_name}")
-                self.stats['tables_dropped'] += 1
+                self.bump_stat('tables_dropped')
                 
-                # Create table with remote structure
-                cursor.execute(create_statement)
+                # Create without secondary indexes: bulk-loading a bare
+                # table and adding indexes afterwards lets InnoDB do one
+                # sort-and-build per index instead of maintaining every
+                # index row by row during the load
+                trimmed_create, deferred_indexes = _split_secondary_indexes(create_statement)
+                cursor.execute(trimmed_create)
+                pending_indexes = deferred_indexes
                 self.log(f"  ✅ Created table {table_name}")
-                self.stats['tables_created'] += 1
-                
+                self.bump_stat('tables_created')
+
+                # Unique conflicts are impossible when copying from a table
+                # with the same constraints, so skip the per-row checks
+                cursor.execute("SET unique_checks = 0")
+
+
                 # Copy all data from remote if there are records
                 if remote_count > 0:
                     # Create progress tracker for record insertion
                     record_progress = ProgressTracker(remote_count, f"{table_name} records")
                     
                     try:
-                        # Get all data from remote
-                        with remote_conn.cursor() as remote_cursor:
-                            remote_cursor.execute(f"SELECT * FROM `{table_name}`")
-                            
-                            # Process in batches for large tables
-                            batch_size = 1000
-                            inserted_count = 0
-                            
-                            while True:
-                                rows = remote_cursor.fetchmany(batch_size)
-                                if not rows:
-                                    break
-                                
-                                # Get column names from first row
-                                if inserted_count == 0:
-                                    # Get column names from the remote cursor description
-                                    columns = [desc[0] for desc in remote_cursor.description]
-                                    placeholders = ", ".join(["%s"] * len(columns))
-                                    column_names = ", ".join([f"`{col}`" for col in columns])
-                                    insert_sql = f"INSERT INTO `{table_name}` ({column_names}) VALUES ({placeholders})"
-                                
-                                # Insert batch
-                                cursor.executemany(insert_sql, rows)
-                                inserted_count += len(rows)
-                                
-                                # Update progress tracker
-                                record_progress.update(len(rows))
+                        # Stream all data from remote (server-side cursor:
+                        # rows arrive as each batch is fetched, not upfront)
+                        with remote_conn.cursor(pymysql.cursors.SSCursor) as remote_cursor:
+                            remote_cursor.execute(f"SELECT * FROM {_quote_identifier(table_name)}")
+
+                            # Build the statement head once from the cursor description
+                            columns = [desc[0] for desc in remote_cursor.description]
+                            column_names = ", ".join(_quote_identifier(col) for col in columns)
+
+                            if self._local_infile_enabled(local_conn):
+                                # Fastest ingestion path: spool to TSV and let the
+                                # server's bulk loader take it in one statement
+                                inserted_count = self._load_data_from_cursor(
+                                    cursor, table_name, column_names, remote_cursor, record_progress)
+                            else:
+                                row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+                                insert_head = f"INSERT INTO {_quote_identifier(table_name)} ({column_names}) VALUES "
+
+                                # Sample the first fetch to size batches against
+                                # max_allowed_packet, then process in batches
+                                inserted_count = 0
+                                first_rows = remote_cursor.fetchmany(1000)
+                                batch_size = self._adaptive_batch_size(
+                                    local_conn, first_rows[0] if first_rows else None)
+
+                                # Every full batch shares one values clause; only
+                                # odd-sized batches need another join
+                                full_batch_values = ", ".join([row_placeholders] * batch_size)
+
+                                def write_batch(rows):
+                                    # One multi-row INSERT per batch: a single statement and
+                                    # round-trip instead of relying on the driver to rewrite
+                                    # executemany row by row
+                                    flat_values = []
+                                    for row in rows:
+                                        flat_values.extend(row)
+                                    values_clause = (full_batch_values if len(rows) == batch_size
+                                                     else ", ".join([row_placeholders] * len(rows)))
+                                    cursor.execute(insert_head + values_clause, flat_values)
+                                    record_progress.update(len(rows))
+
+                                if first_rows:
+                                    write_batch(first_rows)
+                                    inserted_count += len(first_rows)
+                                    # Background fetcher overlaps the remote read
+                                    # with the local insert round-trips
+                                    for rows in self._pipelined_batches(remote_cursor, batch_size):
+                                        write_batch(rows)
+                                        inserted_count += len(rows)
                         
-                        self.stats['records_inserted'] += inserted_count
+                        self.bump_stat('records_inserted', inserted_count)
                         self.log(f"  ✅ Inserted {inserted_count:,} records into {table_name}")
                     finally:
                         record_progress.close()
                 else:
                     self.log(f"  ℹ️  {table_name} is empty (no records to copy)")
-                
+
+                # Rebuild the deferred secondary indexes in one ALTER so
+                # the server does a single build pass per index
+                if deferred_indexes:
+                    self.log(f"  🔧 Building {len(deferred_indexes)} secondary indexes on {table_name}")
+                    cursor.execute(
+                        f"ALTER TABLE {_quote_identifier(table_name)} "
+                        + ", ".join("ADD " + index_def for index_def in deferred_indexes)
+                    )
+                pending_indexes = []
+
+                cursor.execute("SET unique_checks = 1")
+
                 # Re-enable foreign key checks if they were disabled
-                if SYNC_CONFIG.get('disable_foreign_key_checks', True):
+                if self._disable_fk:
                     cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
             
             local_conn.commit()
-            self.stats['tables_synced'] += 1
+            self.bump_stat('tables_synced')
             
         except Exception as e:
             self.log(f"❌ Error drop/recreating {table_name}: {e}", "ERROR")
-            self.stats['errors'] += 1
+            self.bump_stat('errors')
             if not dry_run:
                 local_conn.rollback()
+                # The DROP/CREATE committed implicitly, so the recreated
+                # table survives the rollback stripped of its secondary
+                # indexes; rebuild them now or a later incremental run
+                # would repopulate an unindexed table
+                if pending_indexes:
+                    try:
+                        with local_conn.cursor() as cursor:
+                            cursor.execute(
+                                f"ALTER TABLE {_quote_identifier(table_name)} "
+                                + ", ".join("ADD " + index_def for index_def in pending_indexes)
+                            )
+                        local_conn.commit()
+                        self.log(f"  🔧 Restored {len(pending_indexes)} secondary indexes on {table_name}", "WARNING")
+                    except Exception as index_error:
+                        self.log(f"  ⚠️  Could not restore secondary indexes on {table_name}: {index_error}", "WARNING")
                 # Re-enable foreign key checks on error
                 try:
                     with local_conn.cursor() as cursor:
@@ -714,26 +1457,77 @@ class DatabaseSync:
                 except:
                     pass
     
+    def _bulk_insert_from_remote(self, table_name, local_conn, remote_conn, dry_run,
+                                 columns, column_names):
+        """Fill an empty local table by streaming remote rows into batched inserts.
+
+        Nothing is diffed and no key lists are built, so peak memory is
+        one fetch batch regardless of table size.
+        """
+        with remote_conn.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(table_name)}")
+            remote_count = cursor.fetchone()[0]
+        if not remote_count:
+            return
+
+        self.log(f"📋 {table_name}: Insert={remote_count}, Update=0, Delete=0")
+        if dry_run:
+            return
+
+        record_progress = ProgressTracker(remote_count, f"{table_name} records")
+        try:
+            with remote_conn.cursor(pymysql.cursors.SSCursor) as remote_cursor, \
+                    local_conn.cursor() as cursor:
+                remote_cursor.execute(f"SELECT {column_names} FROM {_quote_identifier(table_name)}")
+                row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+                insert_head = f"INSERT IGNORE INTO {_quote_identifier(table_name)} ({column_names}) VALUES "
+
+                first_rows = remote_cursor.fetchmany(1000)
+                batch_size = self._adaptive_batch_size(
+                    local_conn, first_rows[0] if first_rows else None, default=500)
+                full_batch_values = ", ".join([row_placeholders] * batch_size)
+
+                def write_batch(rows):
+                    flat_values = []
+                    for row in rows:
+                        flat_values.extend(row)
+                    values_clause = (full_batch_values if len(rows) == batch_size
+                                     else ", ".join([row_placeholders] * len(rows)))
+                    cursor.execute(insert_head + values_clause, flat_values)
+                    landed = cursor.rowcount if cursor.rowcount >= 0 else len(rows)
+                    self.bump_stat('records_inserted', landed)
+                    record_progress.update(len(rows))
+
+                if first_rows:
+                    write_batch(first_rows)
+                    # Background fetcher keeps batches coming while the
+                    # main thread runs the inserts
+                    for rows in self._pipelined_batches(remote_cursor, batch_size):
+                        write_batch(rows)
+
+            local_conn.commit()
+            self.bump_stat('tables_synced')
+        finally:
+            record_progress.close()
+
     def handle_foreign_key_errors(self, table_name, operation, error, record_data=None):
         """Enhanced foreign key error handling with detailed logging"""
-        error_msg = str(error).lower()
-        
-        if "foreign key constraint" in error_msg:
-            # Extract foreign key details from error message
-            self.log(f"🔗 {table_name}: Foreign key constraint failed for {operation}", "WARNING")
-            
-            # Log the specific foreign key issue
-            if record_data:
-                self.log(f"  📝 Failed record: {record_data}")
-            
-            # Try to identify the problematic foreign key
-            if "REFERENCES" in str(error):
-                # Extract table and column information
-                self.log(f"  🔍 Foreign key references: {str(error)}")
-            
-            return True  # Indicate this was a foreign key error
-        
-        return False  # Not a foreign key error
+        if not _is_fk_error(error):
+            return False  # Not a foreign key error
+
+        # Extract foreign key details from the error
+        self.log(f"🔗 {table_name}: Foreign key constraint failed for {operation}", "WARNING")
+
+        # Log the specific foreign key issue
+        if record_data:
+            self.log(f"  📝 Failed record: {record_data}")
+
+        # Try to identify the problematic foreign key
+        if "REFERENCES" in str(error):
+            # Extract table and column information
+            self.log(f"  🔍 Foreign key references: {str(error)}")
+
+        return True  # Indicate this was a foreign key error
     
     def sync_table(self, table_name, local_conn, remote_conn, dry_run=False):
         """Sync a single table using either incremental sync or drop/recreate mode"""
@@ -760,39 +1554,126 @@ class DatabaseSync:
             pk_columns = self.get_table_primary_key(table_name, remote_conn)
             if not pk_columns:
                 self.log(f"⚠️  Skipping {table_name}: No primary key found", "WARNING")
-                self.stats['skipped'] += 1
+                self.bump_stat('skipped')
                 return
-            
-            # Get all records from both databases
-            with remote_conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(f"SELECT * FROM `{table_name}`")
-                remote_records = cursor.fetchall()
-            
-            with local_conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(f"SELECT * FROM `{table_name}`")
-                local_records = cursor.fetchall()
-            
-            # Create lookup dictionaries using primary key
-            def make_key(record, pk_cols):
-                if len(pk_cols) == 1:
-                    return record[pk_cols[0]]
-                return tuple(record[col] for col in pk_cols)
-            
-            remote_dict = {make_key(r, pk_columns): r for r in remote_records}
-            local_dict = {make_key(r, pk_columns): r for r in local_records}
-            
-            # Find differences
-            remote_keys = set(remote_dict.keys())
-            local_keys = set(local_dict.keys())
-            
-            to_insert = remote_keys - local_keys
-            to_delete = local_keys - remote_keys
+
+            # Skip tables the remote hasn't touched since the last
+            # successful sync: UPDATE_TIME + approximate row count from
+            # one information_schema query compared against the on-disk
+            # manifest. A NULL UPDATE_TIME (engine doesn't track it, or
+            # the server restarted) never matches, so those tables are
+            # diffed as before.
+            remote_status = self.get_remote_table_status(table_name, remote_conn)
+            if (not dry_run and SYNC_CONFIG.get('skip_unchanged_tables', True)
+                    and remote_status is not None
+                    and remote_status['update_time'] is not None
+                    and remote_status == self._sync_manifest.get(table_name)):
+                self.log(f"⏭️  {table_name}: Unchanged since last sync, skipping")
+                self.bump_stat('skipped')
+                return
+
+
+            # Push row hashing down to the servers: both sides compute a
+            # per-row CRC32 and only pk+checksum pairs cross the tunnel.
+            # Full rows are then fetched just for the keys that actually
+            # differ, so a mostly-unchanged table costs a few bytes per
+            # row instead of the whole table.
+            columns = self.get_table_columns(table_name, remote_conn)
+            if not columns:
+                self.log(f"⚠️  Skipping {table_name}: No columns found", "WARNING")
+                self.bump_stat('skipped')
+                return
+            column_names = ", ".join(_quote_identifier(col) for col in columns)
+            pk_idx = [columns.index(col) for col in pk_columns]
+
+            # Key fetched rows by primary key with a C-level callable:
+            # itemgetter avoids a Python frame per row
+            key_fn = itemgetter(pk_idx[0]) if len(pk_idx) == 1 else itemgetter(*pk_idx)
+
+            # Initial-sync fast path: if the local table is empty (e.g.
+            # just created from the remote schema) everything is an
+            # insert, so skip the local checksum query entirely
+            with local_conn.cursor() as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(table_name)}")
+                local_count = cursor.fetchone()[0]
+
+            if not local_count:
+                # Empty local table (e.g. just created): stream remote rows
+                # straight into batched inserts - no key lists, no row map,
+                # peak memory is one fetch batch regardless of table size
+                self._bulk_insert_from_remote(table_name, local_conn, remote_conn,
+                                              dry_run, columns, column_names)
+                if not dry_run and remote_status is not None:
+                    with self._meta_lock:
+                        self._sync_manifest[table_name] = remote_status
+                return
+
+            to_insert = []
             to_update = []
-            
-            # Check for updates
-            for key in remote_keys & local_keys:
-                if remote_dict[key] != local_dict[key]:
-                    to_update.append(key)
+            to_delete = []
+            # Merge-join the two pk-ordered checksum streams: linear
+            # time, O(fetch batch) memory instead of a full
+            # pk -> checksum dict per side
+            remote_iter = self.iter_row_checksums(table_name, remote_conn, pk_columns, columns)
+            local_iter = self.iter_row_checksums(table_name, local_conn, pk_columns, columns)
+            r = next(remote_iter, None)
+            l = next(local_iter, None)
+            while r is not None and l is not None:
+                if r[0] == l[0]:
+                    if r[1] != l[1]:
+                        to_update.append(r[0])
+                    r = next(remote_iter, None)
+                    l = next(local_iter, None)
+                elif r[0] < l[0]:
+                    to_insert.append(r[0])
+                    r = next(remote_iter, None)
+                else:
+                    to_delete.append(l[0])
+                    l = next(local_iter, None)
+            while r is not None:
+                to_insert.append(r[0])
+                r = next(remote_iter, None)
+            while l is not None:
+                to_delete.append(l[0])
+                l = next(local_iter, None)
+
+            # Guard against server/Python collation order disagreeing
+            # on string keys: a key that landed on both sides exists
+            # in both tables, so it is really an update
+            if to_insert and to_delete:
+                misordered = set(to_insert) & set(to_delete)
+                if misordered:
+                    to_insert = [k for k in to_insert if k not in misordered]
+                    to_delete = [k for k in to_delete if k not in misordered]
+                    to_update.extend(misordered)
+
+            # Fetch full rows only for the changed keys, in chunked
+            # IN (...) queries against the remote
+            remote_dict = {}
+            changed = to_insert + to_update
+            if changed:
+                if len(pk_columns) == 1:
+                    fetch_head = (f"SELECT {column_names} FROM {_quote_identifier(table_name)} "
+                                  f"WHERE {_quote_identifier(pk_columns[0])} IN ")
+                    def fetch_params(batch):
+                        return "(" + ", ".join(["%s"] * len(batch)) + ")", list(batch)
+                else:
+                    pk_tuple = "(" + ", ".join(_quote_identifier(col) for col in pk_columns) + ")"
+                    key_placeholders = "(" + ", ".join(["%s"] * len(pk_columns)) + ")"
+                    fetch_head = (f"SELECT {column_names} FROM {_quote_identifier(table_name)} "
+                                  f"WHERE {pk_tuple} IN ")
+                    def fetch_params(batch):
+                        return ("(" + ", ".join([key_placeholders] * len(batch)) + ")",
+                                [v for key in batch for v in key])
+
+                with remote_conn.cursor() as cursor:
+                    batch_size = 1000
+                    for start in range(0, len(changed), batch_size):
+                        batch = changed[start:start + batch_size]
+                        clause, params = fetch_params(batch)
+                        cursor.execute(fetch_head + clause, params)
+                        for r in cursor.fetchall():
+                            remote_dict[key_fn(r)] = r
             
             # Log what would be done
             if to_insert or to_update or to_delete:
@@ -802,106 +1683,129 @@ class DatabaseSync:
                 return
             
             # Enhanced sync operations with better error handling
+            total_fk_errors = 0
             if to_insert or to_update or to_delete:
                 total_operations = len(to_insert) + len(to_update) + len(to_delete)
                 record_progress = ProgressTracker(total_operations, f"{table_name} records")
                 
                 try:
                     with local_conn.cursor() as cursor:
-                        # INSERT new records (with enhanced foreign key error handling)
-                        insert_success = 0
+                        # INSERT and UPDATE share one write pipeline: new and
+                        # changed rows both go through chunked multi-row
+                        # INSERT ... ON DUPLICATE KEY UPDATE statements, so a
+                        # single statement shape covers both phases
                         insert_fk_errors = 0
-                        for key in to_insert:
-                            try:
-                                record = remote_dict[key]
-                                columns = list(record.keys())
-                                values = list(record.values())
-                                
-                                placeholders = ", ".join(["%s"] * len(values))
-                                column_names = ", ".join([f"`{col}`" for col in columns])
-                                
-                                sql = f"INSERT INTO `{table_name}` ({column_names}) VALUES ({placeholders})"
-                                cursor.execute(sql, values)
-                                insert_success += 1
-                                self.stats['records_inserted'] += 1
-                            except Exception as e:
-                                if self.handle_foreign_key_errors(table_name, "INSERT", e, record):
-                                    insert_fk_errors += 1
-                                elif "duplicate entry" in str(e).lower():
-                                    # Skip duplicate key errors but continue
-                                    pass
-                                else:
-                                    # Re-raise other errors
-                                    raise e
-                            finally:
-                                record_progress.update(1)
-                        
-                        # UPDATE existing records (with enhanced foreign key error handling)
-                        update_success = 0
                         update_fk_errors = 0
-                        for key in to_update:
-                            try:
-                                record = remote_dict[key]
-                                
-                                # Build SET clause (exclude primary key columns)
-                                set_clauses = []
-                                values = []
-                                for col, val in record.items():
-                                    if col not in pk_columns:
-                                        set_clauses.append(f"`{col}` = %s")
-                                        values.append(val)
-                                
-                                # Build WHERE clause
-                                where_clauses = []
-                                for col in pk_columns:
-                                    where_clauses.append(f"`{col}` = %s")
-                                    values.append(record[col])
-                                
-                                if set_clauses:  # Only update if there are non-PK columns
-                                    sql = f"UPDATE `{table_name}` SET {', '.join(set_clauses)} WHERE {' AND '.join(where_clauses)}"
-                                    cursor.execute(sql, values)
-                                    update_success += 1
-                                    self.stats['records_updated'] += 1
-                            except Exception as e:
-                                if self.handle_foreign_key_errors(table_name, "UPDATE", e, record):
-                                    update_fk_errors += 1
-                                elif "duplicate entry" in str(e).lower():
-                                    # Skip duplicate key errors but continue
-                                    pass
-                                else:
-                                    # Re-raise other errors
-                                    raise e
-                            finally:
-                                record_progress.update(1)
-                        
-                        # DELETE removed records (with enhanced foreign key error handling)
+                        row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+                        if changed:
+                            pk_set = frozenset(pk_columns)
+                            update_assignments = ", ".join(
+                                f"{_quote_identifier(col)} = VALUES({_quote_identifier(col)})"
+                                for col in columns if col not in pk_set
+                            )
+                            if update_assignments:
+                                upsert_head = f"INSERT INTO {_quote_identifier(table_name)} ({column_names}) VALUES "
+                                upsert_tail = f" ON DUPLICATE KEY UPDATE {update_assignments}"
+                            else:
+                                # Every column is part of the key: nothing to
+                                # update, and duplicates can only be identical
+                                upsert_head = f"INSERT IGNORE INTO {_quote_identifier(table_name)} ({column_names}) VALUES "
+                                upsert_tail = ""
+                            batch_size = self._adaptive_batch_size(
+                                local_conn, remote_dict[changed[0]], default=500)
+                            full_batch_values = ", ".join([row_placeholders] * batch_size)
+                            for start in range(0, len(changed), batch_size):
+                                batch = changed[start:start + batch_size]
+                                # changed is to_insert followed by to_update, so
+                                # the first keys of each batch are the inserts
+                                batch_inserts = max(0, min(len(batch), len(to_insert) - start))
+                                try:
+                                    flat_values = []
+                                    for key in batch:
+                                        flat_values.extend(remote_dict[key])
+                                    values_clause = (full_batch_values if len(batch) == batch_size
+                                                     else ", ".join([row_placeholders] * len(batch)))
+                                    cursor.execute(upsert_head + values_clause + upsert_tail, flat_values)
+                                    self.bump_stat('records_inserted', batch_inserts)
+                                    self.bump_stat('records_updated', len(batch) - batch_inserts)
+                                except Exception:
+                                    # Fall back to per-record upserts so foreign key
+                                    # issues skip only the offending rows
+                                    for offset, key in enumerate(batch):
+                                        record = remote_dict[key]
+                                        operation = "INSERT" if offset < batch_inserts else "UPDATE"
+                                        try:
+                                            cursor.execute(upsert_head + row_placeholders + upsert_tail,
+                                                           record)
+                                            self.bump_stat('records_inserted' if operation == "INSERT"
+                                                           else 'records_updated')
+                                        except Exception as e:
+                                            if self.handle_foreign_key_errors(table_name, operation, e, record):
+                                                if operation == "INSERT":
+                                                    insert_fk_errors += 1
+                                                else:
+                                                    update_fk_errors += 1
+                                            elif _is_duplicate_error(e):
+                                                # Skip duplicate key errors but continue
+                                                pass
+                                            else:
+                                                # Re-raise other errors
+                                                raise e
+                                finally:
+                                    record_progress.update(len(batch))
+
+
+                        # DELETE removed records in chunked IN (...) statements:
+                        # one round-trip per ~1000 keys instead of one per record
                         delete_success = 0
                         delete_fk_errors = 0
-                        for key in to_delete:
+                        delete_keys = list(to_delete)
+
+                        if len(pk_columns) == 1:
+                            delete_head = f"DELETE FROM {_quote_identifier(table_name)} WHERE {_quote_identifier(pk_columns[0])} IN "
+                            def delete_clause(n):
+                                return "(" + ", ".join(["%s"] * n) + ")"
+                            def delete_values(batch):
+                                return list(batch)
+                        else:
+                            pk_tuple = "(" + ", ".join(_quote_identifier(col) for col in pk_columns) + ")"
+                            key_placeholders = "(" + ", ".join(["%s"] * len(pk_columns)) + ")"
+                            delete_head = f"DELETE FROM {_quote_identifier(table_name)} WHERE {pk_tuple} IN "
+                            def delete_clause(n):
+                                return "(" + ", ".join([key_placeholders] * n) + ")"
+                            def delete_values(batch):
+                                return [v for key in batch for v in key]
+
+                        batch_size = 1000
+                        full_batch_clause = delete_clause(batch_size)
+                        single_clause = delete_clause(1)
+                        for start in range(0, len(delete_keys), batch_size):
+                            batch = delete_keys[start:start + batch_size]
                             try:
-                                where_clauses = []
-                                values = []
-                                
-                                if isinstance(key, tuple):
-                                    for i, col in enumerate(pk_columns):
-                                        where_clauses.append(f"`{col}` = %s")
-                                        values.append(key[i])
-                                else:
-                                    where_clauses.append(f"`{pk_columns[0]}` = %s")
-                                    values.append(key)
-                                
-                                sql = f"DELETE FROM `{table_name}` WHERE {' AND '.join(where_clauses)}"
-                                cursor.execute(sql, values)
-                                delete_success += 1
-                                self.stats['records_deleted'] += 1
-                            except Exception as e:
-                                if self.handle_foreign_key_errors(table_name, "DELETE", e):
-                                    delete_fk_errors += 1
-                                else:
-                                    # Re-raise other errors
-                                    raise e
+                                clause = (full_batch_clause if len(batch) == batch_size
+                                          else delete_clause(len(batch)))
+                                cursor.execute(delete_head + clause, delete_values(batch))
+                                # rowcount reports what was actually removed
+                                landed = cursor.rowcount if cursor.rowcount >= 0 else len(batch)
+                                delete_success += landed
+                                self.bump_stat('records_deleted', landed)
+                            except Exception:
+                                # Fall back to per-record deletes so foreign key
+                                # issues skip only the offending rows
+                                for key in batch:
+                                    try:
+                                        cursor.execute(delete_head + single_clause,
+                                                       delete_values([key]))
+                                        delete_success += 1
+                                        self.bump_stat('records_deleted')
+                                    except Exception as e:
+                                        if self.handle_foreign_key_errors(table_name, "DELETE", e):
+                                            delete_fk_errors += 1
+                                        else:
+                                            # Re-raise other errors
+                                            raise e
                             finally:
-                                record_progress.update(1)
+                                record_progress.update(len(batch))
                         
                         # Log detailed results for tables with foreign key issues
                         total_fk_errors = insert_fk_errors + update_fk_errors + delete_fk_errors
@@ -915,13 +1819,22 @@ class DatabaseSync:
                                 self.log(f"    📝 DELETE: {delete_fk_errors} skipped")
                     
                     local_conn.commit()
-                    self.stats['tables_synced'] += 1
+                    self.bump_stat('tables_synced')
                 finally:
                     record_progress.close()
-            
+
+            # Table is now in sync - record remote status so the next
+            # run can skip it if the remote hasn't changed. Not recorded
+            # when FK errors skipped rows: the table is only partially
+            # synced, and marking it clean would stop exactly the retry
+            # (after parent tables catch up) that would fix those rows
+            if remote_status is not None and total_fk_errors == 0:
+                with self._meta_lock:
+                    self._sync_manifest[table_name] = remote_status
+
         except Exception as e:
             self.log(f"❌ Error syncing {table_name}: {e}", "ERROR")
-            self.stats['errors'] += 1
+            self.bump_stat('errors')
             if not dry_run:
                 local_conn.rollback()
     
@@ -978,7 +1891,14 @@ class DatabaseSync:
         
         # Determine connection method
         use_direct = SYNC_CONFIG.get('use_direct_connection', False)
-        
+
+        # Optional autodetect: if the database port answers a direct TCP
+        # probe (same VPC/LAN), the fastest tunnel is no tunnel at all
+        if not use_direct and SYNC_CONFIG.get('auto_direct_connection', False):
+            if self._probe_direct():
+                self.log("Remote database reachable directly - skipping SSH tunnel")
+                use_direct = True
+
         if use_direct:
             self.log("Using direct database connection (bypassing SSH tunnel)")
             tunnel_success = True
@@ -1008,6 +1928,9 @@ class DatabaseSync:
         sync_mode = "DROP/RECREATE" if SYNC_CONFIG.get('use_drop_recreate_mode', False) else "INCREMENTAL"
         multi_pass = SYNC_CONFIG.get('enable_multi_pass_sync', False)
         
+        # Buffered INFO ("📊 Found N tables to sync", FK analysis) must
+        # land before the plan and the confirmation prompt, not after
+        self.flush_logs()
         print(f"\n📊 Sync Plan Summary:")
         print(f"   🔗 Connection: {connection_method}")
         if not use_direct:
@@ -1019,7 +1942,7 @@ class DatabaseSync:
             print(f"   🔄 Multi-pass sync: ENABLED (3 passes for FK handling)")
         if sync_mode == "DROP/RECREATE":
             print(f"   ⚠️  WARNING: All local table data will be completely replaced!")
-            if SYNC_CONFIG.get('disable_foreign_key_checks', True):
+            if self._disable_fk:
                 print(f"   🔧 Foreign key checks will be temporarily disabled")
         print(f"   📋 Tables to sync: {len(sync_tables)}")
         print(f"   🚫 Tables excluded: {len(self.excluded_tables)} explicit + patterns: {self.excluded_patterns}")
@@ -1046,6 +1969,7 @@ class DatabaseSync:
         
         # Ask for confirmation AFTER showing all the details
         if not dry_run and SYNC_CONFIG.get('require_confirmation', True):
+            self.flush_logs()
             print(f"\n⚠️  Ready to sync {len(sync_tables)} tables from remote to local database")
             if SYNC_CONFIG.get('use_drop_recreate_mode', False):
                 print("   This will DROP each table and recreate it with fresh data from remote")
@@ -1062,61 +1986,49 @@ class DatabaseSync:
                 return False
         
         try:
-            # Get database connections
-            self.log("Establishing database connections...")
-            local_conn = pymysql.connect(
-                host=self.local_db_host, port=self.local_db_port,
-                user=self.local_db_user, password=self.local_db_password,
-                database=self.local_db_name, charset='utf8mb4',
-                autocommit=False
-            )
-            
-            if use_direct:
-                remote_conn = pymysql.connect(
-                    host=self.remote_db_host, port=self.remote_db_port,
-                    user=self.remote_db_user, password=self.remote_db_password,
-                    database=self.remote_db_name, charset='utf8mb4',
-                    connect_timeout=SYNC_CONFIG.get('connection_timeout', 60),
-                    read_timeout=SYNC_CONFIG.get('mysql_read_timeout', 120),
-                    write_timeout=SYNC_CONFIG.get('mysql_write_timeout', 120),
-                    autocommit=False
-                )
-            else:
-                remote_conn = pymysql.connect(
-                    host='localhost', port=self.local_tunnel_port,
-                    user=self.remote_db_user, password=self.remote_db_password,
-                    database=self.remote_db_name, charset='utf8mb4',
-                    connect_timeout=SYNC_CONFIG.get('connection_timeout', 60),
-                    read_timeout=SYNC_CONFIG.get('mysql_read_timeout', 120),
-                    write_timeout=SYNC_CONFIG.get('mysql_write_timeout', 120),
-                    autocommit=False
-                )
-            
-            self.log("✅ Database connections established")
-            print()
-            
-            # Choose sync method based on configuration
-            if multi_pass:
-                self.log("Starting multi-pass table synchronization...")
-                self.multi_pass_sync(sync_tables, local_conn, remote_conn, dry_run)
+            parallel_workers = SYNC_CONFIG.get('parallel_workers', 1)
+
+            if not multi_pass and parallel_workers > 1:
+                # Independent tables sync concurrently over a pool of
+                # connection pairs (see _sync_tables_parallel)
+                self.log(f"Starting parallel table synchronization ({parallel_workers} workers)...")
+                self._sync_tables_parallel(sync_tables, use_direct, dry_run, parallel_workers)
             else:
-                self.log("Starting table synchronization...")
-                # Create progress tracker for tables
-                table_progress = ProgressTracker(len(sync_tables), "Syncing tables")
-                
-                try:
-                    # Sync each table
-                    for i, table in enumerate(sync_tables, 1):
-                        table_progress.set_description(f"Syncing {table} ({i}/{len(sync_tables)})")
-                        self.sync_table(table, local_conn, remote_conn, dry_run)
-                        table_progress.update(1)
-                finally:
-                    table_progress.close()
-            
-            # Close connections
-            local_conn.close()
-            remote_conn.close()
-            
+                # Get database connections
+                self.log("Establishing database connections...")
+                local_conn = self._connect_local()
+                remote_conn = self._connect_remote(use_direct)
+                if not SYNC_CONFIG.get('use_drop_recreate_mode', False):
+                    self._prepare_local_session(local_conn)
+
+                self.log("✅ Database connections established")
+                print()
+
+                # Choose sync method based on configuration
+                if multi_pass:
+                    self.log("Starting multi-pass table synchronization...")
+                    self.multi_pass_sync(sync_tables, local_conn, remote_conn, dry_run)
+                else:
+                    self.log("Starting table synchronization...")
+                    # Create progress tracker for tables
+                    table_progress = ProgressTracker(len(sync_tables), "Syncing tables")
+
+                    try:
+                        # Sync each table
+                        for i, table in enumerate(sync_tables, 1):
+                            table_progress.set_description(f"Syncing {table} ({i}/{len(sync_tables)})")
+                            self.sync_table(table, local_conn, remote_conn, dry_run)
+                            table_progress.update(1)
+                    finally:
+                        table_progress.close()
+
+                # Close connections
+                local_conn.close()
+                remote_conn.close()
+
+            if not dry_run:
+                self._save_sync_manifest()
+
             # Print final statistics
             print("\n" + "="*60)
             self.log("Synchronization completed!", "SUCCESS")
@@ -1142,11 +2054,25 @@ class DatabaseSync:
             self.log(f"Sync failed: {e}", "ERROR")
             return False
         finally:
+            self.flush_logs()
+            leftover = self._setup_remote_conn
+            self._setup_remote_conn = None
+            if leftover is not None:
+                try:
+                    leftover.close()
+                except Exception:
+                    pass
             if not use_direct:
                 self.close_tunnel()
     
     def close_tunnel(self):
         """Close SSH tunnel"""
+        if self._tunnel_forwarder is not None:
+            try:
+                self._tunnel_forwarder.stop()
+            except Exception:
+                pass
+            self._tunnel_forwarder = None
         if self.tunnel_process:
             self.tunnel_process.terminate()
             try:
@@ -1155,30 +2081,56 @@ class DatabaseSync:
                 self.tunnel_process.kill()
             self.tunnel_process = None
 
+def _parse_cli_args(argv):
+    """Parse command line flags (load_config already consumed --config).
+
+    One pass over argv with real validation - unknown flags fail loudly
+    instead of being silently ignored by substring scans. Help stays
+    custom so the module docstring remains the usage text.
+    """
+    parser = argparse.ArgumentParser(prog='sync_database.py', add_help=False)
+    parser.add_argument('--help', '-h', action='store_true', dest='show_help')
+    parser.add_argument('--test-connection', '--test', action='store_true', dest='test_only')
+    parser.add_argument('--dry-run', '-d', action='store_true', dest='dry_run')
+    parser.add_argument('--drop-recreate', action='store_true', dest='drop_recreate')
+    return parser.parse_args(argv)
+
+
 def main():
     """Main function"""
+    args = _parse_cli_args(sys.argv[1:])
+
     sync = DatabaseSync()
-    
+
     def signal_handler(sig, frame):
         print("\n\n⚠️  Interrupted by user")
-        sync.close_tunnel()
-        sys.exit(0)
+        # Best-effort flush: the interrupted frame may already hold the
+        # log lock, so never block on it inside a signal handler
+        if sync._log_lock.acquire(timeout=0.5):
+            try:
+                sync._flush_logs_locked()
+            finally:
+                sync._log_lock.release()
+        try:
+            sync.close_tunnel()
+        except Exception:
+            pass
+        # os._exit skips interpreter teardown: no re-entrant unwinding
+        # of frames interrupted mid-statement and no second cleanup pass
+        # over connections the workers may still hold. 130 = 128+SIGINT
+        os._exit(130)
     
     signal.signal(signal.SIGINT, signal_handler)
-    
-    # Check for test connection argument
-    test_only = "--test-connection" in sys.argv or "--test" in sys.argv
-    
-    # Check for dry run argument
-    dry_run = "--dry-run" in sys.argv or "-d" in sys.argv
-    
-    # Check for drop/recreate mode argument
-    if "--drop-recreate" in sys.argv:
+
+    test_only = args.test_only
+    dry_run = args.dry_run
+
+    if args.drop_recreate:
         SYNC_CONFIG['use_drop_recreate_mode'] = True
         print("🔥 DROP/RECREATE MODE ENABLED via command line")
-    
+
     # Show help
-    if "--help" in sys.argv or "-h" in sys.argv:
+    if args.show_help:
         print(__doc__)
         print("\nAdditional options:")
         print("  --test-connection    Test database connections only (no sync)")
@@ -1207,7 +2159,12 @@ def main():
                 sys.exit(1)
             
             # Test connections
-            if sync.test_connections_method(False):
+            result = sync.test_connections_method(False)
+            # This path never enters run_sync, whose finally is the usual
+            # home of the end-of-run flush - push out the buffered INFO
+            # (table counts, server version) before the verdict prints
+            sync.flush_logs()
+            if result:
                 print("\n✅ All connections working successfully!")
                 print("You can now run the actual sync with: python sync_database.py --dry-run")
             else: